@@ -1,6 +1,26 @@
 """
 Configuration package for CurAIos.
+
+Re-exports are resolved lazily (PEP 562) so importing the package does
+not pull in settings and constants at startup.
 """
 
-from config.settings import get_settings, init_settings
-from config.constants import InputType, OutputFormat, DATA_TYPE_VARIANTS, SPECIAL_CASE_INPUTS
+import importlib
+
+_EXPORTS = {
+    "get_settings": "config.settings",
+    "init_settings": "config.settings",
+    "InputType": "config.constants",
+    "OutputFormat": "config.constants",
+    "DATA_TYPE_VARIANTS": "config.constants",
+    "SPECIAL_CASE_INPUTS": "config.constants",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -10,7 +10,8 @@ GitHub: https://github.com/rezwan-lab
 """
 
 from enum import Enum
-from typing import Dict, List, Set
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple
 
 
 class InputType(Enum):
@@ -58,6 +59,19 @@ SPECIAL_CASE_INPUTS = {
     "infectious disease": {"type": InputType.DISEASE.value, "expansion": ["infection", "bacterial infection", "viral infection"]}
 }
 
+@lru_cache(maxsize=None)
+def get_variant_index() -> Dict[str, str]:
+    """
+    Build the inverted {variant_lower: canonical} index over
+    DATA_TYPE_VARIANTS on first use.
+    """
+    return {
+        variant.lower(): canonical
+        for canonical, variants in DATA_TYPE_VARIANTS.items()
+        for variant in variants
+    }
+
+
 NCBI_TAXONOMY_API = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
 NCBI_TAXONOMY_SUMMARY = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
 NCBI_MESH_API = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
@@ -66,40 +80,65 @@ NCBI_MESH_SUMMARY = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi
 HTTP_MAX_RETRIES = 3
 HTTP_RETRY_BACKOFF = 0.5  # seconds
 
-LLM_PROMPTS = {
-    "organism_validation": (
-        "You are a biology expert tasked with identifying the correct organism name. "
-        "Given the user input '{input}', identify the most likely organism name and "
-        "respond in JSON format like this: {{\"canonical_name\": \"Homo sapiens\", "
-        "\"ncbi_taxonomy_id\": 9606, \"confidence\": 0.95, \"alternatives\": [\"Human\"]}}. "
-        "Use standard scientific nomenclature where applicable. "
-        "If you are unsure, set a lower confidence score."
-    ),
-    "disease_validation": (
-        "You are a medical expert tasked with identifying the correct disease name. "
-        "Given the user input '{input}', identify the most likely disease name and "
-        "respond in JSON format like this: {{\"canonical_name\": \"Alzheimer's Disease\", "
-        "\"mesh_id\": \"D000544\", \"confidence\": 0.95, \"alternatives\": [\"Alzheimer Disease\", \"Dementia, Alzheimer Type\"]}}. "
-        "Use standard medical terminology where applicable. "
-        "If you are unsure, set a lower confidence score."
-    ),
-    "data_type_validation": (
-        "You are a bioinformatics expert tasked with identifying the correct data type. "
-        "Given the user input '{input}', identify the most likely experimental data type and "
-        "respond in JSON format like this: {{\"canonical_name\": \"RNAseq\", "
-        "\"confidence\": 0.95, \"alternatives\": [\"RNA sequencing\", \"Transcriptomics\"]}}. "
-        "Use standard bioinformatics terminology where applicable. "
-        "If you are unsure, set a lower confidence score."
-    ),
-    "query_expansion": (
-        "You are a bioinformatics expert tasked with expanding a search query for biomedical datasets. "
-        "Based on these normalized inputs: "
-        "Organism: {organism}, Disease: {disease}, Data Type: {data_type}, "
-        "generate a comprehensive search query that would find relevant datasets. "
-        "Include relevant synonyms, abbreviations, and related terms. "
-        "Format your response as a JSON object with a single 'query' field containing the expanded query string."
-    )
-}
+# Requests per second allowed against each LLM provider host
+LLM_RATE_LIMIT = 5.0
+
+@lru_cache(maxsize=None)
+def get_llm_prompts() -> Dict[str, Tuple[str, str]]:
+    """
+    Build the LLM prompt templates on first use.
+    Each entry is a (static_system, user_template) pair. The static
+    instruction text is sent as the system message so LLM providers can
+    cache the stable prefix across calls; only the user template carries
+    per-call variables. Construction is deferred so invocations that
+    never touch the LLM (--help, fuzzy-only normalization) skip it.
+    """
+    return {
+        "organism_validation": (
+            (
+                "You are a biology expert tasked with identifying the correct organism name. "
+                "Given a user input, identify the most likely organism name and "
+                "respond in JSON format like this: {\"canonical_name\": \"Homo sapiens\", "
+                "\"ncbi_taxonomy_id\": 9606, \"confidence\": 0.95, \"alternatives\": [\"Human\"]}. "
+                "Use standard scientific nomenclature where applicable. "
+                "If you are unsure, set a lower confidence score."
+            ),
+            "The user input is '{input}'."
+        ),
+        "disease_validation": (
+            (
+                "You are a medical expert tasked with identifying the correct disease name. "
+                "Given a user input, identify the most likely disease name and "
+                "respond in JSON format like this: {\"canonical_name\": \"Alzheimer's Disease\", "
+                "\"mesh_id\": \"D000544\", \"confidence\": 0.95, \"alternatives\": [\"Alzheimer Disease\", \"Dementia, Alzheimer Type\"]}. "
+                "Use standard medical terminology where applicable. "
+                "If you are unsure, set a lower confidence score."
+            ),
+            "The user input is '{input}'."
+        ),
+        "data_type_validation": (
+            (
+                "You are a bioinformatics expert tasked with identifying the correct data type. "
+                "Given a user input, identify the most likely experimental data type and "
+                "respond in JSON format like this: {\"canonical_name\": \"RNAseq\", "
+                "\"confidence\": 0.95, \"alternatives\": [\"RNA sequencing\", \"Transcriptomics\"]}. "
+                "Use standard bioinformatics terminology where applicable. "
+                "If you are unsure, set a lower confidence score."
+            ),
+            "The user input is '{input}'."
+        ),
+        "query_expansion": (
+            (
+                "You are a bioinformatics expert tasked with expanding a search query for biomedical datasets. "
+                "Based on the normalized inputs provided, "
+                "generate a comprehensive search query that would find relevant datasets. "
+                "Include relevant synonyms, abbreviations, and related terms. "
+                "Format your response as a JSON object with a single 'query' field containing the expanded query string."
+            ),
+            "Organism: {organism}, Disease: {disease}, Data Type: {data_type}."
+        )
+    }
+
 
 ERROR_MESSAGES = {
     "api_timeout": "Connection to external API timed out. Please try again later.",
@@ -109,3 +148,11 @@ ERROR_MESSAGES = {
     "no_results": "No results found for the given query parameters.",
     "plugin_error": "Error in plugin {plugin_name}: {error}"
 }
+
+
+def __getattr__(name: str):
+    # Keep `from config.constants import LLM_PROMPTS` working while the
+    # dict itself is built lazily (PEP 562).
+    if name == "LLM_PROMPTS":
+        return get_llm_prompts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,10 +11,17 @@ GitHub: https://github.com/rezwan-lab
 
 import os
 import logging
-from dataclasses import dataclass
+import pickle
+import threading
+from dataclasses import dataclass, fields
 from typing import Optional, Dict, Any, List
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _settings = None
 
 
@@ -26,12 +33,17 @@ class Settings:
     llm_embedding_model: str = "openai/text-embedding-ada-002"
     llm_temperature: float = 0.1
     llm_max_tokens: int = 1000
+    # Off by default: query building stays a local string concatenation
+    # unless the LLM round-trip is explicitly requested.
+    use_llm_enhancement: bool = False
     
     # External API Configuration
     ncbi_api_key: str = ""
     ncbi_email: str = ""
     ncbi_tool: str = "CurAIos"
-    ncbi_rate_limit: float = 0.34  # Requests per second (3 per 10 seconds)
+    # Requests per second; 0 means NCBI's documented rate (3/s without
+    # an API key, 10/s with one).
+    ncbi_rate_limit: float = 0.0
     
     cache_enabled: bool = True
     cache_dir: str = "data/cache"
@@ -52,31 +64,113 @@ class Settings:
     
     def to_dict(self) -> Dict[str, Any]:
         return {k: v for k, v in self.__dict__.items()}
-    
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Settings':
-        settings = cls()
-        for key, value in data.items():
-            if hasattr(settings, key):
-                setattr(settings, key, value)
-        return settings
+        known = {k: v for k, v in data.items() if k in _SETTINGS_FIELDS}
+
+        unknown = data.keys() - _SETTINGS_FIELDS
+        if unknown:
+            print(f"Warning: Ignoring unknown settings keys: {', '.join(sorted(unknown))}")
+
+        return cls(**known)
+
+
+# Field names resolved once so merging dict sources is a single
+# set-membership filter instead of a hasattr/setattr loop per key.
+_SETTINGS_FIELDS = frozenset(f.name for f in fields(Settings))
+
+
+# Generated config files (setup_project.generate_config and the
+# config.json.template it mirrors) use nested sections while Settings
+# fields are flat; this table maps each nested key to its field. Keys
+# mapped to None are recognized parts of the config shape that Settings
+# does not carry (they are consumed elsewhere or reserved), so they are
+# dropped without a warning.
+_CONFIG_KEY_MAP = {
+    ("llm", "api_key"): "llm_api_key",
+    ("llm", "model"): "llm_model",
+    ("llm", "embedding_model"): "llm_embedding_model",
+    ("llm", "temperature"): "llm_temperature",
+    ("llm", "max_tokens"): "llm_max_tokens",
+    ("llm", "use_enhancement"): "use_llm_enhancement",
+    ("ncbi", "api_key"): "ncbi_api_key",
+    ("ncbi", "email"): "ncbi_email",
+    ("ncbi", "tool"): "ncbi_tool",
+    ("ncbi", "rate_limit"): "ncbi_rate_limit",
+    ("logging", "level"): "log_level",
+    ("logging", "file"): "log_file",
+    ("logging", "audit_file"): None,
+    ("repositories", "enabled"): None,
+    ("repositories", "max_results_per_source"): None,
+    ("cache", "enabled"): "cache_enabled",
+    ("cache", "dir"): "cache_dir",
+    ("cache", "ttl"): "cache_ttl",
+    ("fuzzy_matching", "threshold"): "fuzzy_threshold",
+    ("semantic_matching", "threshold"): "semantic_threshold",
+    ("plugins", "enabled"): "plugins_enabled",
+    ("plugins", "dirs"): None,
+}
+
+
+def _flatten_config(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a parsed config file onto the flat Settings field names.
+    Nested sections go through _CONFIG_KEY_MAP; top-level flat keys are
+    accepted as-is when they name a Settings field, so hand-written flat
+    configs keep working. Only genuinely unrecognized keys warn.
+    """
+    flat: Dict[str, Any] = {}
+    unknown = []
+
+    for key, value in data.items():
+        if not isinstance(value, dict):
+            if key in _SETTINGS_FIELDS:
+                flat[key] = value
+            else:
+                unknown.append(key)
+            continue
+
+        for sub_key, sub_value in value.items():
+            try:
+                field = _CONFIG_KEY_MAP[(key, sub_key)]
+            except KeyError:
+                unknown.append(f"{key}.{sub_key}")
+                continue
+            if field is not None:
+                flat[field] = sub_value
+
+    if unknown:
+        print(f"Warning: Ignoring unknown settings keys: {', '.join(sorted(unknown))}")
+
+    return flat
+
+
+_env_settings_cache = None
 
 
 def load_env_settings() -> Dict[str, Any]:
-    env_settings = {}
-    
-    # LLM settings
-    # Look for OPENROUTER_API_KEY first, then fall back to BIODATA_LLM_API_KEY
-    env_settings["llm_api_key"] = os.environ.get("OPENROUTER_API_KEY") or os.environ.get("BIODATA_LLM_API_KEY", "")
-    env_settings["llm_model"] = os.environ.get("BIODATA_LLM_MODEL", "deepseek/deepseek-chat")
-    
-    # NCBI settings
-    env_settings["ncbi_api_key"] = os.environ.get("BIODATA_NCBI_API_KEY", "")
-    env_settings["ncbi_email"] = os.environ.get("BIODATA_NCBI_EMAIL", "")
-    
-    env_settings["log_level"] = os.environ.get("BIODATA_LOG_LEVEL", "INFO")
-    
-    return {k: v for k, v in env_settings.items() if v}
+    # Environment variables are not expected to change after process
+    # start, so they are read once and served from a module-level cache.
+    global _env_settings_cache
+
+    if _env_settings_cache is None:
+        env_settings = {}
+
+        # LLM settings
+        # Look for OPENROUTER_API_KEY first, then fall back to BIODATA_LLM_API_KEY
+        env_settings["llm_api_key"] = os.environ.get("OPENROUTER_API_KEY") or os.environ.get("BIODATA_LLM_API_KEY", "")
+        env_settings["llm_model"] = os.environ.get("BIODATA_LLM_MODEL", "deepseek/deepseek-chat")
+
+        # NCBI settings
+        env_settings["ncbi_api_key"] = os.environ.get("BIODATA_NCBI_API_KEY", "")
+        env_settings["ncbi_email"] = os.environ.get("BIODATA_NCBI_EMAIL", "")
+
+        env_settings["log_level"] = os.environ.get("BIODATA_LOG_LEVEL", "INFO")
+
+        _env_settings_cache = {k: v for k, v in env_settings.items() if v}
+
+    return dict(_env_settings_cache)
 
 
 def load_config_file(config_path: str = None) -> Dict[str, Any]:
@@ -87,28 +181,107 @@ def load_config_file(config_path: str = None) -> Dict[str, Any]:
         return {}
     
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        parsed = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (ValueError, IOError) as e:
         print(f"Warning: Failed to load config file {config_path}: {e}")
         return {}
 
+    return _flatten_config(parsed)
+
+
+# Snapshot of the parsed config file, validated against its mtime so
+# repeat invocations skip the read+parse when nothing changed. Stored
+# under the default cache dir since cache_dir itself is configurable.
+_SNAPSHOT_PATH = os.path.join(Settings.cache_dir, ".settings.pkl")
+
+
+def _config_mtime(config_path: str) -> int:
+    try:
+        return os.stat(config_path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_snapshot():
+    try:
+        with open(_SNAPSHOT_PATH, 'rb') as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+    # Older snapshots lacked the config path; treat them as absent.
+    return snapshot if isinstance(snapshot, tuple) and len(snapshot) == 3 else None
+
+
+def _save_snapshot(config_path: str, mtime_ns: int, overrides: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(os.path.dirname(_SNAPSHOT_PATH), exist_ok=True)
+        with open(_SNAPSHOT_PATH, 'wb') as f:
+            pickle.dump((config_path, mtime_ns, overrides), f)
+    except OSError as e:
+        logging.getLogger(__name__).debug(f"Could not write settings snapshot: {e}")
+
+
+def _build_settings(overrides: Dict[str, Any]) -> Settings:
+    # Env always wins and is re-applied per process, so the snapshot only
+    # needs to cover the file-derived layer.
+    merged = dict(overrides)
+    merged.update(load_env_settings())
+
+    settings = Settings.from_dict(merged)
+    os.makedirs(settings.cache_dir, exist_ok=True)
+    os.makedirs(settings.output_dir, exist_ok=True)
+    return settings
+
+
+def _refresh_settings(config_path: str, mtime_ns: int) -> None:
+    global _settings
+    overrides = load_config_file(config_path)
+    _settings = _build_settings(overrides)
+    _save_snapshot(config_path, mtime_ns, overrides)
+
 
 def init_settings(config_path: Optional[str] = None) -> None:
     global _settings
 
-    settings_dict = Settings().to_dict()
-    
-    config_settings = load_config_file(config_path)
-    settings_dict.update(config_settings)
-    
-    env_settings = load_env_settings()
-    settings_dict.update(env_settings)
-    
-    _settings = Settings.from_dict(settings_dict)
-    
-    os.makedirs(_settings.cache_dir, exist_ok=True)
-    os.makedirs(_settings.output_dir, exist_ok=True)
+    # Re-entry with no explicit path is a no-op: tests, interactive mode
+    # and repeated main() calls would otherwise re-read and re-merge the
+    # config every time.
+    if _settings is not None and config_path is None:
+        return
+
+    resolved_path = config_path or os.environ.get("BIODATA_CONFIG", "config/config.json")
+    mtime_ns = _config_mtime(resolved_path)
+
+    if config_path is not None:
+        # An explicit --config must take effect for this process; the
+        # stale-while-revalidate path could let a short-lived CLI run
+        # exit before the background refresh ever lands.
+        _refresh_settings(resolved_path, mtime_ns)
+        return
+
+    snapshot = _load_snapshot()
+    if snapshot is not None:
+        snapshot_path, snapshot_mtime, overrides = snapshot
+
+        # A snapshot taken for a different config file says nothing
+        # about this one (every missing file reports mtime 0, so the
+        # path has to be part of the comparison).
+        if snapshot_path == resolved_path:
+            if snapshot_mtime == mtime_ns:
+                _settings = _build_settings(overrides)
+                return
+
+            # Stale-while-revalidate: serve the last-known settings now
+            # and let a background thread pick up the changed config file.
+            _settings = _build_settings(overrides)
+            threading.Thread(
+                target=_refresh_settings, args=(resolved_path, mtime_ns), daemon=True
+            ).start()
+            return
+
+    _refresh_settings(resolved_path, mtime_ns)
 
 
 def get_settings() -> Settings:
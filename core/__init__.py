@@ -5,4 +5,13 @@ Core functionality package for BioData Curator.
 from core.normalization import normalize_input
 from core.validation import validate_input
 from core.search_query import build_search_query
-from core.llm_service import get_llm_service
+
+
+def __getattr__(name):
+    # get_llm_service drags in the whole LLM stack (requests, numpy);
+    # resolve it lazily so importing core stays cheap for the common
+    # non-LLM paths.
+    if name == "get_llm_service":
+        from core.llm_service import get_llm_service
+        return get_llm_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,24 +11,333 @@ GitHub: https://github.com/rezwan-lab
 
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config.settings import get_settings
-from config.constants import LLM_PROMPTS
+from config.constants import LLM_PROMPTS, HTTP_MAX_RETRIES, HTTP_RETRY_BACKOFF, LLM_RATE_LIMIT
 from utils.error_handling import LLMError, APIError
+from utils.rate_limiting import acquire_for_host
 
 logger = logging.getLogger(__name__)
 
+# Completions requested above this temperature are non-deterministic,
+# so caching them would pin one arbitrary sample forever.
+CACHEABLE_TEMPERATURE = 0.2
+
+# Matches a ```json fenced block first, then falls back to the widest
+# bare-brace span, replacing the old chain of split/find string passes.
+_JSON_RE = re.compile(r"```json\s*(\{.*?\})\s*```|(\{.*\})", re.S)
+
+
+# Fixed response schemas for entity validation, keyed by entity type.
+# Each field maps to (coercer, default) so a parsed response is shaped
+# and type-checked in a single pass over the known keys instead of
+# being handed downstream as an arbitrary dict.
+_VALIDATION_SCHEMAS = {
+    "organism": (
+        ("canonical_name", str, ""),
+        ("ncbi_taxonomy_id", int, None),
+        ("confidence", float, 0.0),
+        ("alternatives", list, ()),
+    ),
+    "disease": (
+        ("canonical_name", str, ""),
+        ("mesh_id", str, None),
+        ("confidence", float, 0.0),
+        ("alternatives", list, ()),
+    ),
+    "data_type": (
+        ("canonical_name", str, ""),
+        ("confidence", float, 0.0),
+        ("alternatives", list, ()),
+    ),
+}
+
+
+def _coerce_validation(parsed: Dict[str, Any], entity_type: str) -> Dict[str, Any]:
+    """
+    Shape a parsed validation response to its known schema.
+    Args:
+        parsed: Raw dict from the JSON parser
+        entity_type: Key into _VALIDATION_SCHEMAS
+    Returns:Dict with exactly the schema's keys, values coerced to type
+    """
+    schema = _VALIDATION_SCHEMAS.get(entity_type)
+    if schema is None or not parsed:
+        return parsed
+
+    out = {}
+    for field, coerce, default in schema:
+        value = parsed.get(field)
+        if value is None:
+            out[field] = list(default) if coerce is list else default
+            continue
+        if not isinstance(value, coerce):
+            try:
+                value = coerce(value)
+            except (TypeError, ValueError):
+                value = list(default) if coerce is list else default
+        out[field] = value
+    return out
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON with orjson when available, falling back to stdlib json."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _collect_sse_content(response) -> str:
+    """
+    Assemble a completion from a chat SSE stream.
+    Chunks are parsed as they arrive, so processing overlaps with the
+    network transfer instead of waiting for the last token before the
+    first byte is parsed.
+    Args:response: A streaming requests.Response from a chat endpoint
+    Returns:The concatenated message content
+    """
+    parts = []
+
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+
+        payload = line[len(b"data:"):].strip()
+        if payload == b"[DONE]":
+            break
+
+        try:
+            chunk = _loads(payload)
+        except ValueError:
+            logger.debug(f"Skipping malformed SSE chunk: {payload!r}")
+            continue
+
+        choices = chunk.get("choices") or []
+        if choices:
+            content = (choices[0].get("delta") or {}).get("content")
+            if content:
+                parts.append(content)
+
+    return "".join(parts)
+
+
+def cosine_matrix(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Compute pairwise cosine similarities between two embedding matrices.
+    Each matrix is L2-normalized once and the (N, M) similarity matrix
+    comes out of a single matrix multiply, instead of N*M per-pair
+    dot/norm calls at Python level.
+    Args:
+        A: Array of shape (N, dim)
+        B: Array of shape (M, dim)
+    Returns:Array of shape (N, M) with similarities between 0 and 1
+    """
+    A = np.asarray(A, dtype=np.float32)
+    B = np.asarray(B, dtype=np.float32)
+
+    An = A / np.linalg.norm(A, axis=1, keepdims=True).clip(min=1e-12)
+    Bn = B / np.linalg.norm(B, axis=1, keepdims=True).clip(min=1e-12)
+
+    return An @ Bn.T
+
+
+class _ResponseCache:
+    """
+    Persistent exact-match cache for LLM responses.
+
+    Entries are keyed on SHA-256 of (llm_string, prompt) where llm_string
+    identifies the model configuration, so a model or parameter change
+    never serves stale responses. Backed by SQLite under settings.cache_dir
+    with entries expiring after settings.cache_ttl seconds.
+    """
+
+    def __init__(self, cache_dir: str, ttl: int):
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+        self._db_path = os.path.join(cache_dir, "llm_responses.db")
+        # The cache is shared by validate_entities worker threads, so
+        # the connection is opened cross-thread and serialized by a lock.
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT, created REAL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256((llm_string + "\0" + prompt).encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[str]:
+        key = self.make_key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, created = row
+            if self.ttl and (time.time() - created) > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+        return value
+
+    def update(self, prompt: str, llm_string: str, value: str) -> None:
+        key = self.make_key(prompt, llm_string)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+            self._conn.commit()
+
+
+class EmbeddingStore:
+    """
+    Structure-of-arrays store for cached embeddings.
+
+    Vectors live in one contiguous (N, dim) float16 matrix with a
+    parallel key list, so similarity scans stream sequentially through a
+    single buffer instead of decoding one cached vector per key. Half
+    precision halves size and read bandwidth; the resulting cosine error
+    is below 1e-3, far under semantic_threshold. Persisted under
+    settings.cache_dir as one .npy file (memory-mapped on load, so
+    startup cost is independent of cache size) plus a JSON key list.
+    """
+
+    _GROW = 1024
+
+    def __init__(self, cache_dir: str):
+        os.makedirs(cache_dir, exist_ok=True)
+        self._mat_path = os.path.join(cache_dir, "emb.npy")
+        self._keys_path = os.path.join(cache_dir, "emb_keys.json")
+        self._lock = threading.Lock()
+
+        self._buf: Optional[np.ndarray] = None  # (capacity, dim) float16
+        self.keys: List[str] = []
+        self.idx: Dict[str, int] = {}
+        self._count = 0
+        self._dirty = False
+        self._load()
+
+    @property
+    def mat(self) -> Optional[np.ndarray]:
+        """The (N, dim) float16 matrix of stored vectors (a view)."""
+        if self._buf is None:
+            return None
+        return self._buf[:self._count]
+
+    def _load(self) -> None:
+        if not (os.path.exists(self._mat_path) and os.path.exists(self._keys_path)):
+            return
+        try:
+            buf = np.load(self._mat_path, mmap_mode="r")
+            with open(self._keys_path, 'rb') as f:
+                keys = _loads(f.read())
+            if buf.ndim == 2 and len(keys) == buf.shape[0]:
+                self._buf = buf
+                self._count = len(keys)
+                self.keys = list(keys)
+                self.idx = {key: i for i, key in enumerate(keys)}
+        except Exception as e:
+            logger.warning(f"Could not load embedding store: {e}")
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the stored vector for key as float32, or None."""
+        i = self.idx.get(key)
+        if i is None:
+            return None
+        return np.asarray(self._buf[i], dtype=np.float32)
+
+    def add(self, key: str, vector: List[float]) -> None:
+        """Append a vector under key; no-op if the key is already stored."""
+        vec = np.asarray(vector, dtype=np.float16)
+
+        with self._lock:
+            if key in self.idx:
+                return
+
+            if self._buf is None:
+                self._buf = np.empty((self._GROW, vec.shape[0]), dtype=np.float16)
+            elif self._count == self._buf.shape[0] or not self._buf.flags.writeable:
+                # Grow in chunks (and materialize the read-only mmap on
+                # the first post-load append) instead of reallocating
+                # per vector.
+                grown = np.empty(
+                    (self._count + self._GROW, self._buf.shape[1]), dtype=np.float16
+                )
+                grown[:self._count] = self._buf[:self._count]
+                self._buf = grown
+
+            self._buf[self._count] = vec
+            self.idx[key] = self._count
+            self.keys.append(key)
+            self._count += 1
+            self._dirty = True
+
+    def top_k(self, query_vector: List[float], k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Return the k stored keys most similar to query_vector.
+        One GEMM over the contiguous matrix plus an argpartition, so
+        cost is a single streaming pass regardless of k.
+        Args:
+            query_vector: The embedding to search with
+            k: Number of results to return
+        Returns:List of (key, similarity) pairs, best first
+        """
+        if self._count == 0:
+            return []
+
+        q = np.asarray(query_vector, dtype=np.float32)
+        sims = cosine_matrix(q[None, :], self.mat)[0]
+
+        k = min(k, self._count)
+        top = np.argpartition(sims, -k)[-k:]
+        top = top[np.argsort(sims[top])[::-1]]
+
+        return [(self.keys[i], float(sims[i])) for i in top]
+
+    def save(self) -> None:
+        """Persist the matrix and key list if anything was added."""
+        with self._lock:
+            if not self._dirty or self._buf is None:
+                return
+            try:
+                np.save(self._mat_path, self._buf[:self._count])
+                with open(self._keys_path, 'w') as f:
+                    json.dump(self.keys, f)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Could not persist embedding store: {e}")
+
 
 class LLMService:
-    
+
     def __init__(self):
         self.settings = get_settings()
         self.api_key = self.settings.llm_api_key
@@ -38,37 +347,104 @@ class LLMService:
         self.max_tokens = self.settings.llm_max_tokens
         
         self.provider = self.model.split('/')[0] if '/' in self.model else "openai"
-    
-    def generate_completion(self, prompt: str, temperature: Optional[float] = None) -> str:
+
+        # One pooled session for all providers: connections are kept
+        # alive across calls (saves a TLS handshake per request) and
+        # transient failures are retried with backoff.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=HTTP_MAX_RETRIES,
+                backoff_factor=HTTP_RETRY_BACKOFF,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["POST"]
+            )
+        ))
+
+        # Headers and payload skeletons never change within a process;
+        # build them once instead of re-allocating dicts per call.
+        self._openai_headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        self._anthropic_headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01"
+        }
+        self._openrouter_headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+            "HTTP-Referer": "https://example.com"  # Replace with actual domain
+        }
+        self._openai_model = self.model.replace("openai/", "")
+        self._anthropic_model = self.model.replace("anthropic/", "")
+        self._base_payload = {"max_tokens": self.max_tokens}
+
+        self._response_cache = None
+        self._embedding_store = None
+        if self.settings.cache_enabled:
+            try:
+                self._response_cache = _ResponseCache(
+                    self.settings.cache_dir, self.settings.cache_ttl
+                )
+            except Exception as e:
+                logger.warning(f"Could not initialize LLM response cache: {e}")
+            try:
+                self._embedding_store = EmbeddingStore(self.settings.cache_dir)
+            except Exception as e:
+                logger.warning(f"Could not initialize embedding store: {e}")
+
+    def generate_completion(self, prompt: str, temperature: Optional[float] = None,
+                            system: Optional[str] = None) -> str:
         """
         Generate text completion from LLM.
         Args:
             prompt: The input prompt text
             temperature: Optional override for temperature parameter
+            system: Optional static instruction text sent as the system
+                message so providers can cache the stable prefix
         Returns:Generated text response
         Raises:LLMError: If there's an error communicating with the LLM API
         """
         if not self.api_key:
             logger.warning("LLM API key not set. Using fallback methods.")
             return ""
-            
+
         temp = temperature if temperature is not None else self.temperature
-        
+
+        llm_string = f"{self.model}|{temp}|{self.max_tokens}"
+        cache_prompt = f"{system}\0{prompt}" if system else prompt
+        cacheable = self._response_cache is not None and temp <= CACHEABLE_TEMPERATURE
+
+        if cacheable:
+            cached = self._response_cache.lookup(cache_prompt, llm_string)
+            if cached is not None:
+                logger.debug("LLM response cache hit")
+                return cached
+
         try:
             if self.api_key.startswith("sk-or-"):
-                return self._openrouter_completion(prompt, temp)
+                response = self._openrouter_completion(prompt, temp, system)
             elif self.provider == "openai":
-                return self._openai_completion(prompt, temp)
+                response = self._openai_completion(prompt, temp, system)
             elif self.provider == "anthropic":
-                return self._anthropic_completion(prompt, temp)
+                response = self._anthropic_completion(prompt, temp, system)
             else:
                 logger.warning(f"Unsupported LLM provider: {self.provider}. Using OpenRouter as fallback.")
-                return self._openrouter_completion(prompt, temp)
-                
+                response = self._openrouter_completion(prompt, temp, system)
+
         except Exception as e:
             logger.error(f"Error generating LLM completion: {e}", exc_info=True)
             raise LLMError(f"Failed to generate text: {e}")
 
+        if cacheable:
+            self._response_cache.update(cache_prompt, llm_string, response)
+
+        return response
+
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for a list of texts.
@@ -76,20 +452,61 @@ class LLMService:
         Returns:List of embedding vectors
         Raises:LLMError: If there's an error communicating with the embedding API
         """
+        return self.embed_many(texts)
+
+    def embed_many(self, texts: List[str], batch_size: int = 256) -> List[List[float]]:
+        """
+        Embed many texts with deduplication, batching, and persistent caching.
+        Duplicate inputs collapse to a single embedding call, cached vectors
+        skip the network entirely, and remaining unique texts are POSTed in
+        chunks of batch_size rather than one request per caller.
+        Args:
+            texts: List of text strings to embed (duplicates allowed)
+            batch_size: Maximum number of texts per embeddings request
+        Returns:List of embedding vectors, aligned with the input order
+        Raises:LLMError: If there's an error communicating with the embedding API
+        """
+        if not texts:
+            return []
+
         if not self.api_key:
             logger.warning("LLM API key not set. Using fallback methods.")
             return [np.zeros(1536).tolist() for _ in texts]  # Return dummy embeddings
-        
+
+        unique = list(dict.fromkeys(texts))
+        vectors: Dict[str, Any] = {}
+
+        # Cache keys carry the model name so switching embedding models
+        # never serves vectors from another space.
+        key_prefix = f"{self.embedding_model}\0"
+
+        if self._embedding_store is not None:
+            for text in unique:
+                cached = self._embedding_store.get(key_prefix + text)
+                if cached is not None:
+                    vectors[text] = cached
+
+        missing = [text for text in unique if text not in vectors]
+
         try:
-            if "openai" in self.embedding_model:
-                return self._openai_embeddings(texts)
-            else:
+            if missing and "openai" not in self.embedding_model:
                 logger.warning(f"Unsupported embedding model: {self.embedding_model}. Using OpenAI as fallback.")
-                return self._openai_embeddings(texts)
-                
+
+            for start in range(0, len(missing), batch_size):
+                chunk = missing[start:start + batch_size]
+                for text, vector in zip(chunk, self._openai_embeddings(chunk)):
+                    vectors[text] = np.asarray(vector, dtype=np.float32)
+                    if self._embedding_store is not None:
+                        self._embedding_store.add(key_prefix + text, vector)
+
+            if missing and self._embedding_store is not None:
+                self._embedding_store.save()
+
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}", exc_info=True)
             raise LLMError(f"Failed to generate embeddings: {e}")
+
+        return [vectors[text] for text in texts]
     
     def semantic_similarity(self, text1: str, text2: str) -> float:
         """
@@ -99,19 +516,42 @@ class LLMService:
             text2: Second text
         Returns:Cosine similarity score between 0 and 1
         """
+        return float(self.semantic_similarity_many(text1, [text2])[0])
+
+    def semantic_similarity_many(self, query: str, candidates: List[str]) -> np.ndarray:
+        """
+        Score a query against many candidates in one pass.
+        All texts go through a single batched embedding call and one
+        cosine_matrix GEMM, instead of one embed-plus-compare round trip
+        per candidate. The word-overlap fallback tokenizes the query once
+        and scans the candidates in a single loop.
+        Args:
+            query: The text to compare against each candidate
+            candidates: List of candidate texts
+        Returns:Array of similarity scores aligned with candidates
+        """
+        if not candidates:
+            return np.empty(0, dtype=np.float32)
+
         try:
-            embeddings = self.generate_embeddings([text1, text2])
-            return self._cosine_similarity(embeddings[0], embeddings[1])
+            vectors = np.asarray(self.embed_many([query] + candidates), dtype=np.float32)
+            return cosine_matrix(vectors[:1], vectors[1:])[0]
         except Exception as e:
             logger.warning(f"Error calculating semantic similarity: {e}. Falling back to simpler methods.")
-            words1 = set(text1.lower().split())
-            words2 = set(text2.lower().split())
-            
-            if not words1 or not words2:
-                return 0.0
-                
-            overlap = len(words1.intersection(words2))
-            return overlap / max(len(words1), len(words2))
+
+            scores = np.zeros(len(candidates), dtype=np.float32)
+            query_words = set(query.lower().split())
+
+            if not query_words:
+                return scores
+
+            for i, candidate in enumerate(candidates):
+                candidate_words = set(candidate.lower().split())
+                if candidate_words:
+                    overlap = len(query_words.intersection(candidate_words))
+                    scores[i] = overlap / max(len(query_words), len(candidate_words))
+
+            return scores
     
     def validate_entity(self, input_text: str, entity_type: str) -> Dict[str, Any]:
         """
@@ -124,12 +564,13 @@ class LLMService:
         prompt_key = f"{entity_type}_validation"
         if prompt_key not in LLM_PROMPTS:
             raise ValueError(f"No prompt template found for entity type: {entity_type}")
-            
-        prompt = LLM_PROMPTS[prompt_key].format(input=input_text)
-        
+
+        system, user_template = LLM_PROMPTS[prompt_key]
+        prompt = user_template.format(input=input_text)
+
         try:
-            response = self.generate_completion(prompt)
-            return self._parse_json_response(response)
+            response = self.generate_completion(prompt, system=system)
+            return _coerce_validation(self._parse_json_response(response), entity_type)
         except Exception as e:
             logger.error(f"Error validating {entity_type} entity: {e}", exc_info=True)
             return {
@@ -138,6 +579,32 @@ class LLMService:
                 "alternatives": []
             }
     
+    def validate_entities(self, items: List[Tuple[str, str]],
+                          max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        Validate several entities concurrently.
+        The (input_text, entity_type) pairs are independent network-bound
+        calls, so they run on a bounded thread pool and wall-clock time
+        divides by the effective concurrency. Results stay aligned with
+        the input order; per-item failures fall back the same way as
+        validate_entity.
+        Args:
+            items: List of (input_text, entity_type) pairs
+            max_workers: Maximum number of concurrent validation calls
+        Returns:List of validation result dictionaries, in input order
+        """
+        if not items:
+            return []
+
+        if len(items) == 1:
+            input_text, entity_type = items[0]
+            return [self.validate_entity(input_text, entity_type)]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(
+                lambda item: self.validate_entity(item[0], item[1]), items
+            ))
+
     def expand_search_query(self, organism=None, disease=None, data_type=None) -> str:
         """
         Use LLM to expand search query with relevant synonyms and related terms.
@@ -153,15 +620,18 @@ class LLMService:
         if not (organism or disease or data_type):
             logger.warning("No inputs provided for query expansion.")
             return ""
-        prompt = LLM_PROMPTS.get("query_expansion", "Expand the following search terms: organism: {organism}, disease: {disease}, data_type: {data_type}")
-        formatted_prompt = prompt.format(
+        system, user_template = LLM_PROMPTS.get("query_expansion", (
+            "You are a search expert. Expand the given search terms.",
+            "Expand the following search terms: organism: {organism}, disease: {disease}, data_type: {data_type}"
+        ))
+        formatted_prompt = user_template.format(
             organism=organism or "Not specified",
             disease=disease or "Not specified",
             data_type=data_type or "Not specified"
         )
-        
+
         try:
-            response = self.generate_completion(formatted_prompt)
+            response = self.generate_completion(formatted_prompt, system=system)
             try:
                 parsed = self._parse_json_response(response)
                 expanded_query = parsed.get("query", "")
@@ -203,134 +673,134 @@ class LLMService:
             
         return " AND ".join(parts) if parts else ""
     
-    def _openai_completion(self, prompt: str, temperature: float) -> str:
+    def _post(self, url: str, **kwargs):
+        """POST through the shared session after taking a rate-limit token."""
+        acquire_for_host(url, LLM_RATE_LIMIT)
+        return self._session.post(url, **kwargs)
+
+    def _openai_completion(self, prompt: str, temperature: float,
+                           system: Optional[str] = None) -> str:
         url = "https://api.openai.com/v1/chat/completions"
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
+
+        # A leading system message keeps the static prefix stable across
+        # calls so OpenAI's automatic prefix caching engages.
+        messages = [{"role": "system", "content": system}] if system else []
+        messages.append({"role": "user", "content": prompt})
+
         data = {
-            "model": self.model.replace("openai/", ""),
-            "messages": [{"role": "user", "content": prompt}],
+            **self._base_payload,
+            "model": self._openai_model,
+            "messages": messages,
             "temperature": temperature,
-            "max_tokens": self.max_tokens
+            "stream": True
         }
-        
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        
+
+        response = self._post(url, headers=self._openai_headers, json=data, timeout=30, stream=True)
+
         if response.status_code != 200:
             raise APIError(f"OpenAI API error: {response.status_code} - {response.text}")
-            
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
+
+        return _collect_sse_content(response)
     
-    def _anthropic_completion(self, prompt: str, temperature: float) -> str:
+    def _anthropic_completion(self, prompt: str, temperature: float,
+                              system: Optional[str] = None) -> str:
         url = "https://api.anthropic.com/v1/messages"
-        
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01"
-        }
-        
+
         data = {
-            "model": self.model.replace("anthropic/", ""),
+            **self._base_payload,
+            "model": self._anthropic_model,
             "messages": [{"role": "user", "content": prompt}],
-            "temperature": temperature,
-            "max_tokens": self.max_tokens
+            "temperature": temperature
         }
+
+        if system:
+            # cache_control marks the static instruction block for
+            # Anthropic's prompt caching.
+            data["system"] = [{
+                "type": "text",
+                "text": system,
+                "cache_control": {"type": "ephemeral"}
+            }]
         
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        
+        response = self._post(url, headers=self._anthropic_headers, json=data, timeout=30)
+
         if response.status_code != 200:
             raise APIError(f"Anthropic API error: {response.status_code} - {response.text}")
             
         result = response.json()
         return result["content"][0]["text"]
     
-    def _openrouter_completion(self, prompt: str, temperature: float) -> str:
+    def _openrouter_completion(self, prompt: str, temperature: float,
+                               system: Optional[str] = None) -> str:
         url = "https://openrouter.ai/api/v1/chat/completions"
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-            "HTTP-Referer": "https://example.com"  # Replace with actual domain
-        }
-        
+
+        messages = [{"role": "system", "content": system}] if system else []
+        messages.append({"role": "user", "content": prompt})
+
         data = {
+            **self._base_payload,
             "model": self.model,  # Or hard-code "deepseek/deepseek-chat"
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": messages,
             "temperature": temperature,
-            "max_tokens": self.max_tokens
+            "stream": True
         }
-        
-        response = requests.post(url, headers=headers, json=data, timeout=60)
-        
+
+        response = self._post(url, headers=self._openrouter_headers, json=data, timeout=60, stream=True)
+
         if response.status_code != 200:
             raise APIError(f"OpenRouter API error: {response.status_code} - {response.text}")
-            
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
+
+        return _collect_sse_content(response)
     
     def _openai_embeddings(self, texts: List[str]) -> List[List[float]]:
         url = "https://api.openai.com/v1/embeddings"
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
+
         data = {
             "model": self.embedding_model.replace("openai/", ""),
             "input": texts
         }
-        
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+
+        response = self._post(url, headers=self._openai_headers, json=data, timeout=30)
         
         if response.status_code != 200:
             raise APIError(f"OpenAI Embeddings API error: {response.status_code} - {response.text}")
             
         result = response.json()
-        sorted_data = sorted(result["data"], key=lambda x: x["index"])
-        return [item["embedding"] for item in sorted_data]
+        items = result["data"]
+
+        if not items:
+            return []
+
+        # Scatter each vector into place by its index field: one O(N)
+        # pass into a contiguous buffer instead of a sort plus
+        # intermediate lists.
+        out = np.empty((len(items), len(items[0]["embedding"])), dtype=np.float32)
+        for item in items:
+            out[item["index"]] = item["embedding"]
+
+        return out.tolist()
     
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        if not vec1 or not vec2:
+        if len(vec1) == 0 or len(vec2) == 0:
             return 0.0
-            
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
-        
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-            
-        return dot_product / (norm1 * norm2)
+
+        a = np.asarray(vec1, dtype=np.float32)
+        b = np.asarray(vec2, dtype=np.float32)
+
+        return float(cosine_matrix(a[None, :], b[None, :])[0, 0])
     
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            return _loads(response)
+        except ValueError:
+            match = _JSON_RE.search(response)
+
+            if not match:
+                logger.warning(f"Could not extract JSON from response: {response}")
+                return {}
+
             try:
-                if "```json" in response and "```" in response.split("```json", 1)[1]:
-                    json_str = response.split("```json", 1)[1].split("```", 1)[0]
-                    return json.loads(json_str)
-                
-                elif "{" in response and "}" in response:
-                    start_idx = response.find("{")
-                    end_idx = response.rfind("}") + 1
-                    json_str = response[start_idx:end_idx]
-                    return json.loads(json_str)
-                
-                else:
-                    logger.warning(f"Could not extract JSON from response: {response}")
-                    return {}
-                    
+                return _loads(match.group(1) or match.group(2))
             except Exception as e:
                 logger.error(f"Error parsing LLM response as JSON: {e}", exc_info=True)
                 return {}
@@ -10,52 +10,134 @@ Date: 2025
 GitHub: https://github.com/rezwan-lab
 """
 
+import functools
 import logging
 import re
 from typing import Dict, List, Any, Optional, Tuple, Union
 
-from config.constants import InputType, SPECIAL_CASE_INPUTS, DATA_TYPE_VARIANTS
+from config.constants import InputType, SPECIAL_CASE_INPUTS, DATA_TYPE_VARIANTS, get_variant_index
 from config.mappings import ORGANISM_MAPPINGS, DISEASE_MAPPINGS, DATA_TYPE_MAPPINGS
 from external.ncbi_taxonomy import query_ncbi_taxonomy
 from external.ncbi_mesh import query_ncbi_mesh
-from core.llm_service import get_llm_service
 from utils.fuzzy_matching import fuzzy_match, find_best_match
 from utils.error_handling import NormalizationError
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; clean_input runs per user input and per-call
+# re.sub literals would pay the pattern-cache lookup every time.
+_CLEAN_RE = re.compile(r'[^\w\s\-\.]')
 
-def normalize_input(input_value: str, input_type: str) -> Dict[str, Any]:
+# Special-case table keyed on (lowered input, input type) so the check
+# in normalize_input is one tuple-keyed dict probe, folding the type
+# comparison into the lookup itself.
+_SPECIAL_CASE_BY_KEY = {
+    (k.lower(), v["type"]): v for k, v in SPECIAL_CASE_INPUTS.items()
+}
+
+# Mapping tables re-keyed to lowercase once at import, making the
+# lowered-input lookups correct by construction even if a future
+# mappings.py entry arrives mixed-case.
+_ORGANISM_MAPPINGS_LC = {k.lower(): v for k, v in ORGANISM_MAPPINGS.items()}
+_DISEASE_MAPPINGS_LC = {k.lower(): v for k, v in DISEASE_MAPPINGS.items()}
+_DATA_TYPE_MAPPINGS_LC = {k.lower(): v for k, v in DATA_TYPE_MAPPINGS.items()}
+
+# Variant lists lowered once, so the keyword loop stops calling
+# str.lower() on every variant for every input.
+_DATA_TYPE_VARIANTS_LC = tuple(
+    (canonical, tuple(variant.lower() for variant in variants))
+    for canonical, variants in DATA_TYPE_VARIANTS.items()
+)
+
+# All variants compiled into one alternation (longest first, so e.g.
+# "rna sequencing" wins over "rna seq") with a match-text -> canonical
+# table. Finding a variant inside the input is then a single C-level
+# scan instead of a nested Python loop over every variant string.
+_VARIANT_CANONICAL = {
+    variant: canonical
+    for canonical, variants in _DATA_TYPE_VARIANTS_LC
+    for variant in variants
+}
+_VARIANT_KEYWORD_RE = re.compile(
+    '|'.join(re.escape(v) for v in sorted(_VARIANT_CANONICAL, key=len, reverse=True))
+)
+
+# Candidate key sequences for fuzzy matching, materialized once instead
+# of rebuilding a list of every mapping key per normalization call.
+_ORGANISM_KEYS = tuple(_ORGANISM_MAPPINGS_LC)
+_DISEASE_KEYS = tuple(_DISEASE_MAPPINGS_LC)
+_DATA_TYPE_KEYS = tuple(_DATA_TYPE_MAPPINGS_LC)
+
+# One flat exact-match index for data types, folding the mapping table
+# and the variant inverted index into a single dict probe. Each value
+# carries the confidence/source the separate lookup paths used to
+# report; mapping entries win key collisions.
+_DATA_TYPE_INDEX = {
+    key: (record, 1.0, "local_mapping")
+    for key, record in _DATA_TYPE_MAPPINGS_LC.items()
+}
+for _variant, _canonical in get_variant_index().items():
+    _DATA_TYPE_INDEX.setdefault(
+        _variant, ({"canonical_name": _canonical}, 0.9, "variant_mapping")
+    )
+del _variant, _canonical
+
+
+def _llm_service():
+    # Imported at call time: the LLM stack (requests, numpy) is heavy
+    # and only needed when every local resolution path has missed.
+    from core import llm_service
+    return llm_service.get_llm_service()
+
+
+def _cached_normalizer(maxsize: int = 2048):
+    """
+    Memoize a normalizer, handing each caller a fresh dict.
+    Repeated inputs are common across pipelines and each miss can cost
+    an NCBI or LLM round-trip, so hits must be O(1). The copy on the way
+    out keeps callers that tack on extra keys from poisoning the cached
+    entry. Raised exceptions are never cached, so transient failures
+    stay retryable.
+    """
+    def decorate(func):
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+
+        @functools.wraps(func)
+        def wrapper(input_value: str) -> Dict[str, Any]:
+            return dict(cached(input_value))
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorate
+
+
+def normalize_input(input_value: str, input_type: str,
+                    pre_validated: bool = False) -> Dict[str, Any]:
     """
     Normalize user input to canonical forms.
     Args:
         input_value: The user input string to normalize
         input_type: The type of input ('organism', 'disease', 'data_type')
+        pre_validated: Skip cleaning for input that already went through
+            validate_input, avoiding a second regex pass over the text
     Returns:Dictionary with normalized information
     Raises:NormalizationError: If normalization fails
     """
     logger.info(f"Normalizing {input_type}: {input_value}")
-    
+
     if not input_value:
         raise NormalizationError(f"Empty input for {input_type}")
-    
-    cleaned_input = clean_input(input_value)
-    
-    if cleaned_input.lower() in SPECIAL_CASE_INPUTS:
-        special_case = SPECIAL_CASE_INPUTS[cleaned_input.lower()]
-        if special_case["type"] == input_type:
-            logger.info(f"Detected special case input: {cleaned_input}")
-            return handle_special_case(cleaned_input.lower(), input_type)
+
+    cleaned_input = input_value if pre_validated else clean_input(input_value)
+
+    lowercase_input = cleaned_input.lower()
+    special_case = _SPECIAL_CASE_BY_KEY.get((lowercase_input, input_type))
+    if special_case is not None:
+        logger.info(f"Detected special case input: {cleaned_input}")
+        return handle_special_case(lowercase_input, special_case)
     
     try:
-        if input_type == InputType.ORGANISM.value:
-            return normalize_organism(cleaned_input)
-        elif input_type == InputType.DISEASE.value:
-            return normalize_disease(cleaned_input)
-        elif input_type == InputType.DATA_TYPE.value:
-            return normalize_data_type(cleaned_input)
-        else:
-            return normalize_generic(cleaned_input)
+        return _NORMALIZERS.get(input_type, normalize_generic)(cleaned_input)
     except Exception as e:
         logger.error(f"Error normalizing {input_type} input: {e}", exc_info=True)
         return {
@@ -66,6 +148,7 @@ def normalize_input(input_value: str, input_type: str) -> Dict[str, Any]:
         }
 
 
+@_cached_normalizer()
 def normalize_organism(input_value: str) -> Dict[str, Any]:
     """
     Normalize organism name using NCBI Taxonomy database.
@@ -74,13 +157,15 @@ def normalize_organism(input_value: str) -> Dict[str, Any]:
     """
     # First, exact match in local mappings
     lowercase_input = input_value.lower()
-    if lowercase_input in ORGANISM_MAPPINGS:
-        result = ORGANISM_MAPPINGS[lowercase_input].copy()
-        result["confidence"] = 1.0
-        result["original_input"] = input_value
-        result["source"] = "local_mapping"
-        return result
-        
+    mapping = _ORGANISM_MAPPINGS_LC.get(lowercase_input)
+    if mapping is not None:
+        return {
+            **mapping,
+            "confidence": 1.0,
+            "original_input": input_value,
+            "source": "local_mapping"
+        }
+
     # Second, NCBI Taxonomy API
     try:
         ncbi_result = query_ncbi_taxonomy(input_value)
@@ -93,21 +178,22 @@ def normalize_organism(input_value: str) -> Dict[str, Any]:
     
     # Third, fuzzy matching with local mappings
     best_match, score = find_best_match(
-        input_value, 
-        list(ORGANISM_MAPPINGS.keys()),
+        input_value,
+        _ORGANISM_KEYS,
         threshold=0.85
     )
     
     if best_match:
-        result = ORGANISM_MAPPINGS[best_match].copy()
-        result["confidence"] = score
-        result["original_input"] = input_value
-        result["source"] = "fuzzy_mapping"
-        return result
-        
+        return {
+            **_ORGANISM_MAPPINGS_LC[best_match],
+            "confidence": score,
+            "original_input": input_value,
+            "source": "fuzzy_mapping"
+        }
+
     # Finally, LLM for semantic matching
-    llm_service = get_llm_service()
-    llm_result = llm_service.validate_entity(input_value, "organism")
+    service = _llm_service()
+    llm_result = service.validate_entity(input_value, "organism")
     
     llm_result["original_input"] = input_value
     llm_result["source"] = "llm"
@@ -115,6 +201,7 @@ def normalize_organism(input_value: str) -> Dict[str, Any]:
     return llm_result
 
 
+@_cached_normalizer()
 def normalize_disease(input_value: str) -> Dict[str, Any]:
     """
     Normalize disease name using NCBI MeSH database.
@@ -123,13 +210,15 @@ def normalize_disease(input_value: str) -> Dict[str, Any]:
     """
     # First, exact match in local mappings
     lowercase_input = input_value.lower()
-    if lowercase_input in DISEASE_MAPPINGS:
-        result = DISEASE_MAPPINGS[lowercase_input].copy()
-        result["confidence"] = 1.0
-        result["original_input"] = input_value
-        result["source"] = "local_mapping"
-        return result
-        
+    mapping = _DISEASE_MAPPINGS_LC.get(lowercase_input)
+    if mapping is not None:
+        return {
+            **mapping,
+            "confidence": 1.0,
+            "original_input": input_value,
+            "source": "local_mapping"
+        }
+
     # Second, NCBI MeSH API
     try:
         mesh_result = query_ncbi_mesh(input_value)
@@ -142,21 +231,22 @@ def normalize_disease(input_value: str) -> Dict[str, Any]:
     
     # Third, fuzzy matching with local mappings
     best_match, score = find_best_match(
-        input_value, 
-        list(DISEASE_MAPPINGS.keys()),
+        input_value,
+        _DISEASE_KEYS,
         threshold=0.85
     )
     
     if best_match:
-        result = DISEASE_MAPPINGS[best_match].copy()
-        result["confidence"] = score
-        result["original_input"] = input_value
-        result["source"] = "fuzzy_mapping"
-        return result
-        
+        return {
+            **_DISEASE_MAPPINGS_LC[best_match],
+            "confidence": score,
+            "original_input": input_value,
+            "source": "fuzzy_mapping"
+        }
+
     # Finally, LLM for semantic matching
-    llm_service = get_llm_service()
-    llm_result = llm_service.validate_entity(input_value, "disease")
+    service = _llm_service()
+    llm_result = service.validate_entity(input_value, "disease")
     
     # Enrich result with additional information
     llm_result["original_input"] = input_value
@@ -165,49 +255,65 @@ def normalize_disease(input_value: str) -> Dict[str, Any]:
     return llm_result
 
 
+@_cached_normalizer()
 def normalize_data_type(input_value: str) -> Dict[str, Any]:
     """
     Normalize experimental data type.
     Args:input_value: The data type to normalize
     Returns:Dictionary with normalized data type information
     """
-    # First, exact match in local mappings
+    # First, exact match in the merged mapping+variant index
     lowercase_input = input_value.lower()
-    if lowercase_input in DATA_TYPE_MAPPINGS:
-        result = DATA_TYPE_MAPPINGS[lowercase_input].copy()
-        result["confidence"] = 1.0
-        result["original_input"] = input_value
-        result["source"] = "local_mapping"
-        return result
-        
+    hit = _DATA_TYPE_INDEX.get(lowercase_input)
+    if hit is not None:
+        mapping, confidence, source = hit
+        return {
+            **mapping,
+            "confidence": confidence,
+            "original_input": input_value,
+            "source": source
+        }
+
     # Second, fuzzy matching with local mappings
     best_match, score = find_best_match(
-        input_value, 
-        list(DATA_TYPE_MAPPINGS.keys()),
+        input_value,
+        _DATA_TYPE_KEYS,
         threshold=0.85
     )
-    
+
     if best_match:
-        result = DATA_TYPE_MAPPINGS[best_match].copy()
-        result["confidence"] = score
-        result["original_input"] = input_value
-        result["source"] = "fuzzy_mapping"
-        return result
-        
-    # Third, check for keyword presence in variant mappings
-    for canonical, variants in DATA_TYPE_VARIANTS.items():
+        return {
+            **_DATA_TYPE_MAPPINGS_LC[best_match],
+            "confidence": score,
+            "original_input": input_value,
+            "source": "fuzzy_mapping"
+        }
+
+    # Third, check for keyword presence in variant mappings: one scan
+    # for a variant inside the input, then the rare reverse direction
+    # (input inside a longer variant).
+    keyword_match = _VARIANT_KEYWORD_RE.search(lowercase_input)
+    if keyword_match:
+        return {
+            "canonical_name": _VARIANT_CANONICAL[keyword_match.group(0)],
+            "confidence": 0.8,
+            "original_input": input_value,
+            "source": "keyword_match"
+        }
+
+    for canonical, variants in _DATA_TYPE_VARIANTS_LC:
         for variant in variants:
-            if (variant.lower() in lowercase_input) or (lowercase_input in variant.lower()):
+            if lowercase_input in variant:
                 return {
                     "canonical_name": canonical,
                     "confidence": 0.8,
                     "original_input": input_value,
                     "source": "keyword_match"
                 }
-                
+
     # Finally, LLM for semantic matching
-    llm_service = get_llm_service()
-    llm_result = llm_service.validate_entity(input_value, "data_type")
+    service = _llm_service()
+    llm_result = service.validate_entity(input_value, "data_type")
     
     # result with additional information
     llm_result["original_input"] = input_value
@@ -232,15 +338,24 @@ def normalize_generic(input_value: str) -> Dict[str, Any]:
     }
 
 
-def handle_special_case(input_value: str, input_type: str) -> Dict[str, Any]:
+# Jump table resolving the enum values once at import; normalize_input
+# dispatches with a single dict probe instead of an if/elif chain of
+# descriptor lookups.
+_NORMALIZERS = {
+    InputType.ORGANISM.value: normalize_organism,
+    InputType.DISEASE.value: normalize_disease,
+    InputType.DATA_TYPE.value: normalize_data_type,
+}
+
+
+def handle_special_case(input_value: str, special_case: Dict[str, Any]) -> Dict[str, Any]:
     """
     Handle special case inputs like 'virus' or 'cancer'.
     Args:
-        input_value: The special case input
-        input_type: The type of input 
+        input_value: The special case input (already lowercased)
+        special_case: The matched entry from the special-case table
     Returns:Dictionary with expanded information
     """
-    special_case = SPECIAL_CASE_INPUTS[input_value]
     expansion = special_case.get("expansion", [])
     
     return {
@@ -260,7 +375,6 @@ def clean_input(input_value: str) -> str:
     Returns:Cleaned string
     """
 
-    cleaned = re.sub(r'\s+', ' ', input_value.strip())
-    cleaned = re.sub(r'[^\w\s\-\.]', '', cleaned)
-    
-    return cleaned
+    # str.split handles the strip and whitespace collapse in C, leaving
+    # a single regex pass for the character filter.
+    return _CLEAN_RE.sub('', ' '.join(input_value.split()))
@@ -12,11 +12,13 @@ GitHub: https://github.com/rezwan-lab
 """
 
 import logging
+from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple, Union
-import re
 
-from core.llm_service import get_llm_service
+from functools import lru_cache
+
 from config.constants import SPECIAL_CASE_INPUTS
+from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -55,34 +57,35 @@ def build_search_query(organism: Optional[Dict[str, Any]] = None,
         expanded_terms.extend([f"({term})" for term in disease.get("expanded_terms", [])])
         disease_name = f"({' OR '.join(expanded_terms)})" if expanded_terms else disease_name
     
-    base_query_parts = []
-    
+    # Entity terms and filters accumulate in one list for a single join,
+    # instead of two joins stitched together afterwards.
+    parts = []
+
     if organism_name:
-        base_query_parts.append(f"organism:({organism_name})")
-        
+        parts.append(f"organism:({organism_name})")
+
     if disease_name:
-        base_query_parts.append(f"disease:({disease_name})")
-        
+        parts.append(f"disease:({disease_name})")
+
     if data_type_name:
-        base_query_parts.append(f"data_type:({data_type_name})")
-    
-    filter_parts = []
-    
+        parts.append(f"data_type:({data_type_name})")
+
     if min_samples:
-        filter_parts.append(f"samples:>={min_samples}")
-        
+        parts.append(f"samples:>={min_samples}")
+
     if date_range:
-        filter_parts.append(parse_date_range(date_range))
+        parts.append(parse_date_range(date_range))
 
     if additional_filters:
-        for key, value in additional_filters.items():
-            filter_parts.append(f"{key}:{value}")
+        parts.extend(f"{key}:{value}" for key, value in additional_filters.items())
 
-    query = " AND ".join(base_query_parts) if base_query_parts else ""
-    filters = " AND ".join(filter_parts) if filter_parts else ""
-    
-    combined_query = f"{query} {filters}" if filters else query
-    if organism_name or disease_name or data_type_name:
+    combined_query = " AND ".join(parts)
+
+    # The LLM round-trip is opt-in: the default path is pure local
+    # string building, and the enhanced result is only used when it
+    # actually adds terms.
+    if (get_settings().use_llm_enhancement
+            and (organism_name or disease_name or data_type_name)):
         try:
             llm_query = enhance_query_with_llm(organism_name, disease_name, data_type_name)
             if llm_query and len(llm_query) > len(combined_query):
@@ -94,9 +97,11 @@ def build_search_query(organism: Optional[Dict[str, Any]] = None,
     return combined_query
 
 
+@lru_cache(maxsize=256)
 def enhance_query_with_llm(organism=None, disease=None, data_type=None):
     """
     Use LLM to enhance the search query with relevant synonyms and terms.
+    Memoized on the three names, since pipelines re-run the same inputs.
     Args:
         organism: Normalized organism name (optional)
         disease: Normalized disease name (optional)
@@ -105,12 +110,16 @@ def enhance_query_with_llm(organism=None, disease=None, data_type=None):
     """
     if not (organism or disease or data_type):
         return ""
-        
-    llm_service = get_llm_service()
-    
+
+    # Imported at call time: the LLM stack (requests, numpy) is heavy and
+    # only needed when enhancement is actually requested.
+    from core import llm_service
+
+    service = llm_service.get_llm_service()
+
     try:
-        if hasattr(llm_service, 'expand_search_query'):
-            return llm_service.expand_search_query(organism, disease, data_type)
+        if hasattr(service, 'expand_search_query'):
+            return service.expand_search_query(organism, disease, data_type)
         else:
             logger.warning("LLM service missing expand_search_query method, using local implementation")
             parts = []
@@ -136,23 +145,23 @@ def parse_date_range(date_range: str) -> str:
         date_range: Date range string (e.g., "2020-2023" or "2020-01-01:2023-12-31")
     Returns:Formatted date range filter
     """
-    year_pattern = r'^(\d{4})-(\d{4})$'
-    year_match = re.match(year_pattern, date_range)
-    
-    if year_match:
-        start_year = year_match.group(1)
-        end_year = year_match.group(2)
-        return f"publication_date:[{start_year}-01-01 TO {end_year}-12-31]"
-
-    date_pattern = r'^(\d{4}-\d{2}-\d{2}):(\d{4}-\d{2}-\d{2})$'
-    date_match = re.match(date_pattern, date_range)
-    
-    if date_match:
-        start_date = date_match.group(1)
-        end_date = date_match.group(2)
-        return f"publication_date:[{start_date} TO {end_date}]"
+    # Both accepted shapes are cheap to recognize with str.split and
+    # strptime's C parser; no regex machinery needed for inputs this small.
+    if ":" in date_range:
+        start_date, _, end_date = date_range.partition(":")
+        try:
+            datetime.strptime(start_date, "%Y-%m-%d")
+            datetime.strptime(end_date, "%Y-%m-%d")
+        except ValueError:
+            pass
+        else:
+            return f"publication_date:[{start_date} TO {end_date}]"
+    else:
+        years = date_range.split("-")
+        if len(years) == 2 and all(len(y) == 4 and y.isdigit() for y in years):
+            return f"publication_date:[{years[0]}-01-01 TO {years[1]}-12-31]"
 
-    logger.warning(f"Unrecognized date range format: {date_range}")
+    logger.warning("Unrecognized date range format: %s", date_range)
     return f"publication_date:{date_range}"
 
 
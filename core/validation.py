@@ -11,6 +11,7 @@ GitHub: https://github.com/rezwan-lab
 
 import logging
 import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple, Union
 
 from config.constants import InputType, ERROR_MESSAGES
@@ -18,7 +19,40 @@ from utils.error_handling import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Per-type character filters, compiled once at import so validators
+# skip the regex-cache lookup on every call.
+_ORGANISM_RE = re.compile(r'[^\w\s\-\.]')
+_DISEASE_RE = re.compile(r'[^\w\s\-\'\.]')
+_DATA_TYPE_RE = re.compile(r'[^\w\s\-\/\.]')
+_GENERIC_RE = re.compile(r'[^\w\s\-\/\.\,\'\"]')
+
+# Exact-match term tables as frozensets (O(1) probes) and the substring
+# keyword scans as single compiled alternations, replacing per-keyword
+# Python `in` loops.
+_GENERIC_ORGANISMS = frozenset({"bacteria", "virus", "viruses", "fungi", "animal", "plant"})
+_GENERIC_DATA_TERMS = frozenset({"sequencing", "analysis", "profiling", "data"})
+_DISEASE_KW_RE = re.compile(r'disease|syndrome|disorder|infection|cancer|tumor')
+_ORGANISM_KW_RE = re.compile(r'bacteria|virus|human|mouse|animal|homo sapiens|mus musculus')
+
+# The individual injection patterns are alternated into one compiled
+# regex so validate_generic does a single scan instead of six.
+_DANGEROUS_RE = re.compile(
+    '|'.join([
+        r'\b(select|insert|update|delete|drop|create|alter)\b.*\b(from|table|database)\b',
+        r'\b(union\s+all|union\s+select)\b',
+        r'\-\-',
+        r'\/\*.*\*\/',
+        r'\bexec\b',
+        r'\beval\b'
+    ]),
+    re.IGNORECASE
+)
 
+
+# Memoized on (value, type): validation returns an immutable string, so
+# repeat inputs in batch or interactive runs skip the regex passes.
+# Raised ValidationErrors are never cached, so bad input stays retryable.
+@lru_cache(maxsize=4096)
 def validate_input(input_value: str, input_type: str) -> str:
     logger.debug(f"Validating {input_type}: {input_value}")
     
@@ -30,50 +64,41 @@ def validate_input(input_value: str, input_type: str) -> str:
     if not input_str:
         raise ValidationError(f"Input for {input_type} cannot be empty")
 
-    if input_type == InputType.ORGANISM.value:
-        return validate_organism(input_str)
-    elif input_type == InputType.DISEASE.value:
-        return validate_disease(input_str)
-    elif input_type == InputType.DATA_TYPE.value:
-        return validate_data_type(input_str)
-    else:
-        return validate_generic(input_str)
+    return _VALIDATORS.get(input_type, validate_generic)(input_str)
 
 
 def validate_organism(input_value: str) -> str:
 
-    cleaned = re.sub(r'[^\w\s\-\.]', '', input_value)
-    
+    cleaned = _ORGANISM_RE.sub('', input_value)
+
     if len(cleaned) < 2:
         raise ValidationError("Organism name is too short")
         
     lower_input = cleaned.lower()
     
-    if lower_input in ["bacteria", "virus", "viruses", "fungi", "animal", "plant"]:
+    if lower_input in _GENERIC_ORGANISMS:
         logger.warning(f"Generic organism term detected: {lower_input}")
-        
-    disease_keywords = ["disease", "syndrome", "disorder", "infection", "cancer", "tumor"]
-    if any(keyword in lower_input for keyword in disease_keywords):
+
+    if _DISEASE_KW_RE.search(lower_input):
         logger.warning(f"Input may be a disease rather than an organism: {input_value}")
         
     return cleaned
 
 
 def validate_disease(input_value: str) -> str:
-    cleaned = re.sub(r'[^\w\s\-\'\.]', '', input_value)
+    cleaned = _DISEASE_RE.sub('', input_value)
 
     if len(cleaned) < 2:
         raise ValidationError("Disease name is too short")
     lower_input = cleaned.lower()
-    organism_keywords = ["bacteria", "virus", "human", "mouse", "animal", "homo sapiens", "mus musculus"]
-    if any(keyword in lower_input for keyword in organism_keywords):
+    if _ORGANISM_KW_RE.search(lower_input):
         logger.warning(f"Input may be an organism rather than a disease: {input_value}")
         
     return cleaned
 
 
 def validate_data_type(input_value: str) -> str:
-    cleaned = re.sub(r'[^\w\s\-\/\.]', '', input_value)
+    cleaned = _DATA_TYPE_RE.sub('', input_value)
 
     if len(cleaned) < 2:
         raise ValidationError("Data type is too short")
@@ -86,30 +111,28 @@ def validate_data_type(input_value: str) -> str:
     if lower_input == "scrna":
         logger.info("Converting standalone 'scRNA' to 'scRNAseq'")
         return "scRNAseq"
-    generic_terms = ["sequencing", "analysis", "profiling", "data"]
-    if lower_input in generic_terms:
+    if lower_input in _GENERIC_DATA_TERMS:
         logger.warning(f"Input data type is too generic: {input_value}")
         
     return cleaned
 
 
 def validate_generic(input_value: str) -> str:
-    cleaned = re.sub(r'[^\w\s\-\/\.\,\'\"]', '', input_value)
+    cleaned = _GENERIC_RE.sub('', input_value)
     if len(cleaned) < 2:
         raise ValidationError("Input is too short")
-    lower_input = cleaned.lower()
-    dangerous_patterns = [
-        r'\b(select|insert|update|delete|drop|create|alter)\b.*\b(from|table|database)\b',
-        r'\b(union\s+all|union\s+select)\b',
-        r'\-\-',
-        r'\/\*.*\*\/',
-        r'\bexec\b',
-        r'\beval\b'
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, lower_input):
-            logger.warning(f"Potentially unsafe input detected: {input_value}")
-            raise ValidationError("Input contains potentially unsafe patterns")
-            
-    return cleaned
\ No newline at end of file
+
+    if _DANGEROUS_RE.search(cleaned):
+        logger.warning(f"Potentially unsafe input detected: {input_value}")
+        raise ValidationError("Input contains potentially unsafe patterns")
+
+    return cleaned
+
+
+# Jump table resolving the enum values once at import; validate_input
+# dispatches with a single dict probe instead of an if/elif chain.
+_VALIDATORS = {
+    InputType.ORGANISM.value: validate_organism,
+    InputType.DISEASE.value: validate_disease,
+    InputType.DATA_TYPE.value: validate_data_type,
+}
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+External API clients and data retrieval for BioData Curator.
+"""
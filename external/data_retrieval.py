@@ -0,0 +1,247 @@
+"""
+Metadata retrieval from public data repositories
+(GEO, Figshare, Zenodo, OSF, ScienceDB).
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from config.settings import get_settings
+from external.http_session import SESSION, acquire_ncbi
+from utils.error_handling import APIError
+from utils.file_operations import dump_json_bytes, write_ndjson, _write_results_csv
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 15
+
+NCBI_GDS_SEARCH = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+NCBI_GDS_SUMMARY = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+FIGSHARE_SEARCH = "https://api.figshare.com/v2/articles/search"
+ZENODO_SEARCH = "https://zenodo.org/api/records"
+
+DEFAULT_REPOSITORIES = ("geo", "figshare", "zenodo", "osf", "sciencedb")
+
+# Records are homogeneous per repository, so the CSV header is the union
+# of these small per-repo field sets — O(#repos) at import instead of a
+# per-record .keys() scan at write time. Keep these in sync with the
+# record dicts the fetchers build.
+GEO_FIELDS = frozenset((
+    "id", "accession", "title", "summary", "organism", "type", "url",
+    "platform", "samples", "repository"
+))
+FIGSHARE_FIELDS = frozenset((
+    "id", "title", "url", "doi", "type", "created_date", "repository"
+))
+ZENODO_FIELDS = frozenset((
+    "id", "title", "url", "doi", "type", "created_date", "repository"
+))
+RESULT_FIELDS = sorted(GEO_FIELDS | FIGSHARE_FIELDS | ZENODO_FIELDS)
+
+
+class DataRetriever:
+    """Fetches dataset metadata from the supported repositories."""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.max_results = 100
+
+    def retrieve_all(self, query: str, output_dir: Optional[str] = None,
+                     repositories: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Query all requested repositories and save combined results.
+        The per-repository fetches are independent network calls, so they
+        fan out on a thread pool and wall time approaches the slowest
+        repository instead of the sum of all of them.
+        Args:
+            query: Search query string
+            output_dir: Directory for the detailed result files
+            repositories: Repository names to search (default: all)
+        Returns:Dictionary with query, results, per-source status and counts
+        """
+        repos = [r.strip().lower() for r in (repositories or DEFAULT_REPOSITORIES) if r.strip()]
+        if not repos:
+            repos = list(DEFAULT_REPOSITORIES)
+
+        logger.info("Retrieving metadata from %s for query: %s", ", ".join(repos), query)
+
+        all_results = []
+        sources = {}
+
+        with ThreadPoolExecutor(max_workers=len(repos)) as executor:
+            futures = {
+                repo: executor.submit(self._retrieve_repository, repo, query)
+                for repo in repos
+            }
+
+        for repo, future in futures.items():
+            try:
+                records = future.result()
+                sources[repo] = {"count": len(records), "success": True}
+                all_results.extend(records)
+            except Exception as e:
+                logger.warning("Retrieval from %s failed: %s", repo, e)
+                sources[repo] = {"count": 0, "success": False, "error": str(e)}
+
+        results = {
+            "query": query,
+            "results_count": len(all_results),
+            "results": all_results,
+            "sources": sources
+        }
+
+        if output_dir:
+            self._save_results(results, output_dir)
+
+        return results
+
+    def _retrieve_repository(self, repository: str, query: str) -> List[Dict[str, Any]]:
+        """Dispatch one repository fetch via the fetcher table."""
+        fetcher = self._FETCHERS.get(repository)
+        if fetcher is None:
+            raise APIError(f"Unknown repository: {repository}")
+        return fetcher(self, query)
+
+    def _fetch_geo(self, query: str) -> List[Dict[str, Any]]:
+        """Search NCBI GEO DataSets via E-utilities."""
+        params = {
+            "db": "gds",
+            "term": query,
+            "retmode": "json",
+            "retmax": self.max_results,
+            "tool": self.settings.ncbi_tool
+        }
+        if self.settings.ncbi_api_key:
+            params["api_key"] = self.settings.ncbi_api_key
+
+        acquire_ncbi(NCBI_GDS_SEARCH)
+        response = SESSION.get(NCBI_GDS_SEARCH, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        search = response.json().get("esearchresult", {})
+        id_list = search.get("idlist", [])
+        if not id_list:
+            return []
+
+        params = {
+            "db": "gds",
+            "id": ",".join(id_list),
+            "retmode": "json",
+            "tool": self.settings.ncbi_tool
+        }
+        acquire_ncbi(NCBI_GDS_SUMMARY)
+        response = SESSION.get(NCBI_GDS_SUMMARY, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        summaries = response.json().get("result", {})
+
+        records = []
+        for uid in summaries.get("uids", []):
+            entry = summaries.get(uid, {})
+            accession = entry.get("accession", "")
+            records.append({
+                "id": uid,
+                "accession": accession,
+                "title": entry.get("title", ""),
+                "summary": entry.get("summary", ""),
+                "organism": entry.get("taxon", ""),
+                "type": entry.get("entrytype", "dataset"),
+                "url": f"https://www.ncbi.nlm.nih.gov/geo/query/acc.cgi?acc={accession}",
+                "platform": entry.get("gpl", ""),
+                "samples": entry.get("n_samples", 0),
+                "repository": "GEO"
+            })
+        return records
+
+    def _fetch_figshare(self, query: str) -> List[Dict[str, Any]]:
+        """Search Figshare articles."""
+        payload = {"search_for": query, "page_size": min(self.max_results, 1000)}
+        response = SESSION.post(FIGSHARE_SEARCH, json=payload, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+        return [{
+            "id": str(entry.get("id", "")),
+            "title": entry.get("title", ""),
+            "url": entry.get("url_public_html", entry.get("url", "")),
+            "doi": entry.get("doi", ""),
+            "type": entry.get("defined_type_name", "dataset"),
+            "created_date": entry.get("published_date", ""),
+            "repository": "Figshare"
+        } for entry in response.json()]
+
+    def _fetch_zenodo(self, query: str) -> List[Dict[str, Any]]:
+        """Search Zenodo records."""
+        params = {"q": query, "size": self.max_results}
+        response = SESSION.get(ZENODO_SEARCH, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        hits = response.json().get("hits", {}).get("hits", [])
+
+        return [{
+            "id": str(entry.get("id", "")),
+            "title": entry.get("metadata", {}).get("title", ""),
+            "url": entry.get("links", {}).get("self_html", ""),
+            "doi": entry.get("doi", ""),
+            "type": entry.get("metadata", {}).get("resource_type", {}).get("type", "dataset"),
+            "created_date": entry.get("created", ""),
+            "repository": "Zenodo"
+        } for entry in hits]
+
+    def _fetch_osf(self, query: str) -> List[Dict[str, Any]]:
+        raise APIError("OSF retrieval is not implemented yet")
+
+    def _fetch_sciencedb(self, query: str) -> List[Dict[str, Any]]:
+        raise APIError("ScienceDB retrieval is not implemented yet")
+
+    # Fetcher jump table resolved once at class creation; retrieval
+    # dispatch is a single dict probe.
+    _FETCHERS = {
+        "geo": _fetch_geo,
+        "figshare": _fetch_figshare,
+        "zenodo": _fetch_zenodo,
+        "osf": _fetch_osf,
+        "sciencedb": _fetch_sciencedb,
+    }
+
+    def _save_results(self, results: Dict[str, Any], output_dir: str) -> None:
+        """Write the detailed NDJSON/CSV result files and the summary."""
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Records go out as NDJSON with a uint64 offset sidecar, so
+        # downstream readers can stream line by line or random-access
+        # record N without parsing one giant JSON array.
+        ndjson_path = os.path.join(output_dir, "results.ndjson")
+        offsets_path = os.path.join(output_dir, "results.idx")
+        write_ndjson(results["results"], ndjson_path, offsets_path)
+
+        csv_path = os.path.join(output_dir, "results.csv")
+        _write_results_csv(results["results"], csv_path, RESULT_FIELDS)
+
+        summary_path = os.path.join(output_dir, "summary.json")
+        summary = {k: v for k, v in results.items() if k != "results"}
+        with open(summary_path, 'wb') as f:
+            f.write(dump_json_bytes(summary))
+
+        logger.info("Detailed results saved to %s and %s", ndjson_path, csv_path)
+
+
+_retriever = None
+
+
+def get_data_retriever() -> DataRetriever:
+    """
+    Return the shared DataRetriever instance.
+    A singleton keeps the pooled HTTP session and settings lookups warm
+    across calls instead of rebuilding them per retrieval.
+    Returns:The module-level DataRetriever
+    """
+    global _retriever
+    if _retriever is None:
+        _retriever = DataRetriever()
+    return _retriever
@@ -0,0 +1,68 @@
+"""
+Shared pooled HTTP session for external API calls.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.constants import HTTP_MAX_RETRIES, HTTP_RETRY_BACKOFF
+from config.settings import get_settings
+from utils.rate_limiting import acquire_for_host
+
+# One session shared by all external clients: connections stay alive
+# across calls (saving a DNS lookup and TLS handshake per request) and
+# transient failures are retried with backoff.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_body(response):
+    """
+    Parse a response body, using orjson's C parser on the raw bytes
+    when available; falls back to response.json() otherwise (including
+    for mocked responses without real byte content).
+    Args:response: A requests.Response (or compatible) object
+    Returns:The decoded JSON payload
+    """
+    if orjson is not None and isinstance(response.content, bytes):
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def acquire_ncbi(url: str) -> None:
+    """
+    Take a rate-limit token before an NCBI E-utilities request.
+    NCBI allows 3 requests/s without an API key and 10/s with one;
+    settings.ncbi_rate_limit, when non-zero, overrides that. All eutils
+    endpoints share one host, so every call site going through this
+    helper keeps the process as a whole under the limit.
+    Args:url: The request URL; the bucket is keyed on its host
+    """
+    settings = get_settings()
+    rate = settings.ncbi_rate_limit or (10.0 if settings.ncbi_api_key else 3.0)
+    acquire_for_host(url, rate)
+
+
+SESSION = requests.Session()
+
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
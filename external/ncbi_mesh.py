@@ -0,0 +1,130 @@
+"""
+NCBI MeSH API client for disease name resolution.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import logging
+from typing import Dict, List, Any
+
+from config.constants import NCBI_MESH_API, NCBI_MESH_SUMMARY
+from config.settings import get_settings
+from external.http_session import SESSION, acquire_ncbi, json_body
+from external.ncbi_taxonomy import _calculate_match_confidence
+from utils.caching import disk_memoize
+from utils.error_handling import APIError
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 10  # seconds
+
+
+def _base_params() -> Dict[str, str]:
+    settings = get_settings()
+    params = {"retmode": "json", "tool": settings.ncbi_tool}
+    if settings.ncbi_api_key:
+        params["api_key"] = settings.ncbi_api_key
+    if settings.ncbi_email:
+        params["email"] = settings.ncbi_email
+    return params
+
+
+def _esearch(term: str) -> Dict[str, Any]:
+    params = _base_params()
+    params.update({"db": "mesh", "term": term})
+
+    acquire_ncbi(NCBI_MESH_API)
+    response = SESSION.get(NCBI_MESH_API, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return json_body(response).get("esearchresult", {})
+
+
+@disk_memoize("ncbi_mesh")
+def query_ncbi_mesh(disease_name: str) -> Dict[str, Any]:
+    """
+    Query NCBI MeSH for a disease name.
+    A miss on the exact term is retried once against all fields before
+    giving up. Results are memoized to the shared disk cache, so
+    repeated runs for the same disease skip the network round-trip.
+    Args:disease_name: The disease name to look up
+    Returns:Dictionary with canonical name, MeSH ID, confidence and
+        alternatives; empty dict when nothing matches
+    Raises:APIError: If the API request fails
+    """
+    logger.debug(f"Querying NCBI MeSH for: {disease_name}")
+
+    try:
+        search_result = _esearch(disease_name)
+
+        if int(search_result.get("count", 0)) == 0:
+            search_result = _esearch(f"{disease_name}[All Fields]")
+
+        if int(search_result.get("count", 0)) == 0:
+            logger.debug(f"No NCBI MeSH results for: {disease_name}")
+            return {}
+
+        uid = search_result["idlist"][0]
+
+        summary_params = _base_params()
+        summary_params.update({"db": "mesh", "id": uid})
+
+        acquire_ncbi(NCBI_MESH_SUMMARY)
+        summary_response = SESSION.get(
+            NCBI_MESH_SUMMARY, params=summary_params, timeout=REQUEST_TIMEOUT
+        )
+        summary_response.raise_for_status()
+
+        result = _extract_disease_info(json_body(summary_response), uid)
+
+    except APIError:
+        raise
+    except Exception as e:
+        logger.error(f"NCBI MeSH API error: {e}")
+        raise APIError(f"NCBI MeSH query failed: {e}")
+
+    if result:
+        result["confidence"] = _calculate_match_confidence(
+            disease_name, result["canonical_name"], result.get("alternatives", [])
+        )
+
+    return result
+
+
+def _extract_disease_info(summary_data: Dict[str, Any], uid: str) -> Dict[str, Any]:
+    """
+    Pull disease fields out of an esummary response.
+    Args:
+        summary_data: Parsed esummary JSON
+        uid: The MeSH UID to extract
+    Returns:Dictionary with canonical name, MeSH ID, description and
+        alternatives
+    """
+    info = summary_data.get("result", {}).get(uid)
+    if not info:
+        return {}
+
+    canonical_name = info.get("descriptorname", "")
+
+    alternatives: List[str] = []
+    for concept in info.get("conceptlist", []):
+        concept_name = concept.get("conceptname")
+        if concept_name and concept_name != canonical_name and concept_name not in alternatives:
+            alternatives.append(concept_name)
+
+        for term in concept.get("termlist", []):
+            term_name = term.get("termname")
+            if term_name and term_name != canonical_name and term_name not in alternatives:
+                alternatives.append(term_name)
+
+    return {
+        "canonical_name": canonical_name,
+        "mesh_id": info.get("ui", uid),
+        "description": info.get("scopenote", ""),
+        "tree_numbers": info.get("treenumberlist", []),
+        "alternatives": alternatives
+    }
@@ -0,0 +1,370 @@
+"""
+NCBI Taxonomy API client for organism name resolution.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from config.constants import NCBI_TAXONOMY_API, NCBI_TAXONOMY_SUMMARY
+from config.settings import get_settings
+from external.http_session import SESSION, acquire_ncbi, json_body
+from utils.caching import disk_memoize, seed_cache
+from utils.error_handling import APIError
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 10  # seconds
+
+# Optional offline taxonomy index built from an NCBI taxdump dump (see
+# build_local_taxonomy_index). When present, lookups hit a local B-tree
+# in sub-millisecond time instead of two eutils round-trips.
+LOCAL_DB_NAME = "taxonomy.sqlite"
+
+_local_conn = None
+_local_lock = threading.Lock()
+_local_db_missing = False
+
+
+def _get_local_conn() -> Optional[sqlite3.Connection]:
+    """Open the offline index once, remembering when it doesn't exist."""
+    global _local_conn, _local_db_missing
+
+    if _local_conn is not None or _local_db_missing:
+        return _local_conn
+
+    db_path = os.path.join(get_settings().cache_dir, LOCAL_DB_NAME)
+    if not os.path.exists(db_path):
+        _local_db_missing = True
+        return None
+
+    _local_conn = sqlite3.connect(db_path, check_same_thread=False)
+    return _local_conn
+
+
+def _local_lookup(organism_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Resolve an organism from the offline index, if one is installed.
+    Args:organism_name: The organism name to look up
+    Returns:Result dict in the API shape, or None when unavailable
+    """
+    conn = _get_local_conn()
+    if conn is None:
+        return None
+
+    lowered = organism_name.strip().lower()
+    with _local_lock:
+        row = conn.execute(
+            "SELECT tax_id FROM names WHERE name_lower = ? LIMIT 1", (lowered,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        tax_id = row[0]
+        names = conn.execute(
+            "SELECT name, name_class, rank FROM names WHERE tax_id = ?", (tax_id,)
+        ).fetchall()
+
+    canonical_name = ""
+    rank = ""
+    alternatives: List[str] = []
+    for name, name_class, name_rank in names:
+        if name_class == "scientific name":
+            canonical_name = name
+            rank = name_rank or ""
+        elif name and name not in alternatives:
+            alternatives.append(name)
+
+    if not canonical_name:
+        return None
+
+    return {
+        "canonical_name": canonical_name,
+        "ncbi_taxonomy_id": int(tax_id),
+        "rank": rank,
+        "lineage": "",
+        "alternatives": alternatives,
+        "confidence": _calculate_match_confidence(
+            organism_name, canonical_name, alternatives
+        )
+    }
+
+
+def build_local_taxonomy_index(taxdump_dir: str, db_path: str = None) -> int:
+    """
+    Build the offline index from an unpacked NCBI taxdump directory.
+    Parses names.dmp (and nodes.dmp for ranks, when present) into a
+    SQLite table indexed on the lowercased name, giving query_ncbi_taxonomy
+    a local first stop for the long tail of organisms.
+    Args:
+        taxdump_dir: Directory containing names.dmp / nodes.dmp
+        db_path: Destination database (default: cache_dir/taxonomy.sqlite)
+    Returns:Number of name rows indexed
+    """
+    if db_path is None:
+        db_path = os.path.join(get_settings().cache_dir, LOCAL_DB_NAME)
+
+    ranks = {}
+    nodes_path = os.path.join(taxdump_dir, "nodes.dmp")
+    if os.path.exists(nodes_path):
+        with open(nodes_path, encoding='utf-8') as f:
+            for line in f:
+                fields = [p.strip() for p in line.split("|")]
+                if len(fields) >= 3:
+                    ranks[fields[0]] = fields[2]
+
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("DROP TABLE IF EXISTS names")
+        conn.execute(
+            "CREATE TABLE names ("
+            "tax_id INTEGER, name TEXT, name_lower TEXT, name_class TEXT, rank TEXT)"
+        )
+
+        count = 0
+        with open(os.path.join(taxdump_dir, "names.dmp"), encoding='utf-8') as f:
+            rows = []
+            for line in f:
+                fields = [p.strip() for p in line.split("|")]
+                if len(fields) < 4:
+                    continue
+                tax_id, name, name_class = fields[0], fields[1], fields[3]
+                rows.append((tax_id, name, name.lower(), name_class, ranks.get(tax_id, "")))
+                if len(rows) >= 10000:
+                    conn.executemany("INSERT INTO names VALUES (?,?,?,?,?)", rows)
+                    count += len(rows)
+                    rows = []
+            if rows:
+                conn.executemany("INSERT INTO names VALUES (?,?,?,?,?)", rows)
+                count += len(rows)
+
+        conn.execute("CREATE INDEX idx_names_lower ON names(name_lower)")
+        conn.execute("CREATE INDEX idx_names_taxid ON names(tax_id)")
+        conn.commit()
+    finally:
+        conn.close()
+
+    logger.info(f"Indexed {count} taxonomy names into {db_path}")
+    return count
+
+
+def _base_params() -> Dict[str, str]:
+    settings = get_settings()
+    params = {"retmode": "json", "tool": settings.ncbi_tool}
+    if settings.ncbi_api_key:
+        params["api_key"] = settings.ncbi_api_key
+    if settings.ncbi_email:
+        params["email"] = settings.ncbi_email
+    return params
+
+
+@disk_memoize("ncbi_taxonomy")
+def query_ncbi_taxonomy(organism_name: str) -> Dict[str, Any]:
+    """
+    Query NCBI Taxonomy for an organism name.
+    Results are memoized to the shared disk cache, so repeated runs for
+    the same organism skip the network round-trip entirely.
+    Args:organism_name: The organism name to look up
+    Returns:Dictionary with canonical name, taxonomy ID, confidence and
+        alternatives; empty dict when nothing matches
+    Raises:APIError: If the API request fails
+    """
+    logger.debug(f"Querying NCBI Taxonomy for: {organism_name}")
+
+    local = _local_lookup(organism_name)
+    if local is not None:
+        return local
+
+    try:
+        search_params = _base_params()
+        search_params.update({"db": "taxonomy", "term": organism_name})
+
+        acquire_ncbi(NCBI_TAXONOMY_API)
+        search_response = SESSION.get(
+            NCBI_TAXONOMY_API, params=search_params, timeout=REQUEST_TIMEOUT
+        )
+        search_response.raise_for_status()
+        search_data = json_body(search_response)
+
+        search_result = search_data.get("esearchresult", {})
+        if int(search_result.get("count", 0)) == 0:
+            logger.debug(f"No NCBI Taxonomy results for: {organism_name}")
+            return {}
+
+        uid = search_result["idlist"][0]
+
+        result = _summarize_uid(organism_name, uid)
+
+    except APIError:
+        raise
+    except Exception as e:
+        logger.error(f"NCBI Taxonomy API error: {e}")
+        raise APIError(f"NCBI Taxonomy query failed: {e}")
+
+    return result
+
+
+def _summarize_uid(organism_name: str, uid: str) -> Dict[str, Any]:
+    """Fetch and score the esummary record for one UID."""
+    summary_params = _base_params()
+    summary_params.update({"db": "taxonomy", "id": uid})
+
+    acquire_ncbi(NCBI_TAXONOMY_SUMMARY)
+    summary_response = SESSION.get(
+        NCBI_TAXONOMY_SUMMARY, params=summary_params, timeout=REQUEST_TIMEOUT
+    )
+    summary_response.raise_for_status()
+
+    result = _extract_organism_info(json_body(summary_response), uid)
+
+    if result:
+        result["confidence"] = _calculate_match_confidence(
+            organism_name, result["canonical_name"], result.get("alternatives", [])
+        )
+
+    return result
+
+
+def _search_uid(organism_name: str) -> Optional[str]:
+    """Run the esearch leg for one organism, returning its top UID."""
+    acquire_ncbi(NCBI_TAXONOMY_API)
+
+    search_params = _base_params()
+    search_params.update({"db": "taxonomy", "term": organism_name})
+
+    response = SESSION.get(NCBI_TAXONOMY_API, params=search_params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+
+    search_result = json_body(response).get("esearchresult", {})
+    if int(search_result.get("count", 0)) == 0:
+        return None
+    return search_result["idlist"][0]
+
+
+def query_ncbi_taxonomy_many(organism_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve several organism names in one batched pass.
+    The esearch legs are latency-bound and fan out on a thread pool
+    (throttled by the shared NCBI token bucket); every resolved UID then
+    rides a single multi-UID esummary request, so N names cost N
+    searches plus one summary instead of 2N round-trips.
+    Args:organism_names: Organism names to look up
+    Returns:Mapping of input name to its result dict ({} for misses)
+    """
+    names = list(dict.fromkeys(organism_names))
+    if not names:
+        return {}
+
+    uid_by_name: Dict[str, Optional[str]] = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+        futures = {name: executor.submit(_search_uid, name) for name in names}
+    for name, future in futures.items():
+        try:
+            uid_by_name[name] = future.result()
+        except Exception as e:
+            logger.warning(f"NCBI Taxonomy search failed for {name}: {e}")
+            uid_by_name[name] = None
+
+    uids = sorted({uid for uid in uid_by_name.values() if uid})
+    if not uids:
+        return {name: {} for name in names}
+
+    summary_params = _base_params()
+    summary_params.update({"db": "taxonomy", "id": ",".join(uids)})
+
+    acquire_ncbi(NCBI_TAXONOMY_SUMMARY)
+    response = SESSION.get(NCBI_TAXONOMY_SUMMARY, params=summary_params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    summary_data = json_body(response)
+
+    results = {}
+    for name, uid in uid_by_name.items():
+        if not uid:
+            results[name] = {}
+            continue
+        info = _extract_organism_info(summary_data, uid)
+        if info:
+            info["confidence"] = _calculate_match_confidence(
+                name, info["canonical_name"], info.get("alternatives", [])
+            )
+        results[name] = info
+        # Expand the batch into per-term cache entries so later
+        # query_ncbi_taxonomy calls for these names are disk hits.
+        seed_cache("ncbi_taxonomy", name, info)
+    return results
+
+
+def _extract_organism_info(summary_data: Dict[str, Any], uid: str) -> Dict[str, Any]:
+    """
+    Pull organism fields out of an esummary response.
+    Args:
+        summary_data: Parsed esummary JSON
+        uid: The taxonomy UID to extract
+    Returns:Dictionary with canonical name, taxonomy ID, rank, lineage
+        and alternatives
+    """
+    info = summary_data.get("result", {}).get(uid)
+    if not info:
+        return {}
+
+    canonical_name = info.get("scientificname", "")
+
+    alternatives: List[str] = []
+    common_name = info.get("commonname")
+    if common_name and common_name != canonical_name:
+        alternatives.append(common_name)
+
+    other_names = info.get("othernames", {})
+    for name_list in other_names.values():
+        if not isinstance(name_list, list):
+            continue
+        for name in name_list:
+            if name and name != canonical_name and name not in alternatives:
+                alternatives.append(name)
+
+    return {
+        "canonical_name": canonical_name,
+        "ncbi_taxonomy_id": int(uid),
+        "rank": info.get("rank", ""),
+        "lineage": info.get("lineage", ""),
+        "alternatives": alternatives
+    }
+
+
+def _calculate_match_confidence(input_name: str, canonical_name: str,
+                                alternatives: List[str]) -> float:
+    """
+    Score how well the input matches the resolved record.
+    Args:
+        input_name: The user-supplied name
+        canonical_name: The resolved canonical name
+        alternatives: Known alternative names for the record
+    Returns:Confidence score between 0.8 and 1.0
+    """
+    lowered = input_name.lower()
+    canonical_lower = canonical_name.lower()
+
+    if lowered == canonical_lower:
+        return 1.0
+
+    if any(lowered == alt.lower() for alt in alternatives):
+        return 0.95
+
+    if canonical_lower.startswith(lowered):
+        return 0.9
+
+    if lowered in canonical_lower:
+        return 0.85
+
+    return 0.8
@@ -1,4 +1,4 @@
-import requests
+from external.http_session import SESSION
 
 # Your personal access token
 ACCESS_TOKEN = 'your_token'
@@ -6,7 +6,14 @@ ACCESS_TOKEN = 'your_token'
 # Base URL for Figshare API
 BASE_URL = 'https://api.figshare.com/v2'
 
-# Set headers with token
+# Set headers with token; passed per request so the token never leaks
+# onto the shared session used by other APIs.
 headers = {
     'Authorization': f'token {ACCESS_TOKEN}'
 }
+
+
+def get(path, **kwargs):
+    """Issue a figshare API GET on the shared pooled session."""
+    kwargs.setdefault('headers', headers)
+    return SESSION.get(f"{BASE_URL}{path}", **kwargs)
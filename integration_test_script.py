@@ -10,6 +10,7 @@ import os
 import sys
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from pathlib import Path
 
@@ -24,6 +25,10 @@ from core.validation import validate_input
 from utils.file_operations import save_metadata
 from external.data_retrieval import get_data_retriever
 
+# One-time init flag so repeated pipeline runs in one process don't
+# redo settings and logging setup.
+_initialized = False
+
 
 def test_complete_pipeline(organism: str = None, disease: str = None, data_type: str = None, 
                           output_dir: str = "data/output", repositories: str = None):
@@ -37,14 +42,18 @@ def test_complete_pipeline(organism: str = None, disease: str = None, data_type:
         output_dir: Directory to save results
         repositories: Comma-separated list of repositories to search
     """
+    global _initialized
+
     print("\n===== STARTING COMPLETE PIPELINE TEST =====")
-    
-    # Initialize settings
-    init_settings()
+
+    # Initialize settings and logging once; back-to-back runs in the
+    # same process skip the repeated setup.
+    if not _initialized:
+        init_settings()
+        setup_logging(get_settings().log_level)
+        _initialized = True
+
     settings = get_settings()
-    
-    # Set up logging
-    setup_logging(settings.log_level)
     logger = logging.getLogger(__name__)
     
     # Create repositories list
@@ -61,9 +70,26 @@ def test_complete_pipeline(organism: str = None, disease: str = None, data_type:
         print(f"Data type validation: {valid_data_type}")
         
         print("\n--- Step 2: Normalize Inputs ---")
-        norm_organism = normalize_input(valid_organism, 'organism') if valid_organism else None
-        norm_disease = normalize_input(valid_disease, 'disease') if valid_disease else None
-        norm_data_type = normalize_input(valid_data_type, 'data_type') if valid_data_type else None
+        # The normalizations are independent network-bound lookups, so
+        # they fan out on a small thread pool and the step costs
+        # max-of-RTTs instead of sum-of-RTTs.
+        to_normalize = {
+            'organism': valid_organism,
+            'disease': valid_disease,
+            'data_type': valid_data_type
+        }
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                input_type: executor.submit(
+                    normalize_input, value, input_type, pre_validated=True
+                )
+                for input_type, value in to_normalize.items() if value
+            }
+            normalized = {input_type: future.result() for input_type, future in futures.items()}
+
+        norm_organism = normalized.get('organism')
+        norm_disease = normalized.get('disease')
+        norm_data_type = normalized.get('data_type')
         
         print(f"Normalized organism: {norm_organism}")
         print(f"Normalized disease: {norm_disease}")
@@ -127,8 +153,10 @@ def test_module_versions():
 
 
 if __name__ == "__main__":
-    # Print module versions for debugging
-    test_module_versions()
+    # Version reporting is debug-only: importing numpy just to print a
+    # version string adds a few hundred ms of cold start per run.
+    if os.environ.get("CURAIOS_DEBUG"):
+        test_module_versions()
     
     # Test parameters
     test_organism = "SARS-CoV-2"
@@ -22,33 +22,40 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config.settings import init_settings, get_settings
 from utils.logging_utils import setup_logging
 from ui.cli import parse_arguments
-from ui.interactive import interactive_mode
-from core.normalization import normalize_input
-from core.search_query import build_search_query
-from core.validation import validate_input
-from utils.file_operations import save_metadata
-from external.data_retrieval import get_data_retriever
+
+# The pipeline modules (normalization, retrieval, etc.) pull in numpy
+# and friends, which costs seconds of cold start that --help and
+# interactive mode shouldn't pay. They're imported inside the branches
+# that actually use them.
 
 
 def main():
     """Main entry point for the BioData Curator application."""
-    # Initialize settings
-    init_settings()
+    # Parse arguments before touching settings or logging: --help and
+    # --version exit inside argparse, so those runs never pay for
+    # config I/O or handler setup.
+    args = parse_arguments()
+
+    init_settings(args.config)
     settings = get_settings()
-    
-    # Set up logging
-    setup_logging(settings.log_level)
+
+    setup_logging(args.log_level or settings.log_level,
+                  args.log_file or settings.log_file)
     logger = logging.getLogger(__name__)
     logger.info("Starting CurAIos -  VERSION 0.0.1")
-    
-    # Parse command line arguments
-    args = parse_arguments()
-    
+
     # Use interactive mode if specified or if required inputs are missing
     if args.interactive or (not args.organism and not args.disease and not args.data_type):
+        from ui.interactive import interactive_mode
         return interactive_mode()
-    
+
     try:
+        from core.normalization import normalize_input
+        from core.search_query import build_search_query
+        from core.validation import validate_input
+        from utils.file_operations import save_metadata
+        from external.data_retrieval import get_data_retriever
+
         # Validate and normalize inputs
         logger.info("Validating and normalizing inputs")
         organism = validate_input(args.organism, 'organism') if args.organism else None
@@ -69,7 +76,7 @@ def main():
         )
         
         # Execute query and retrieve results from repositories
-        logger.info(f"Executing search query: {query}")
+        logger.info("Executing search query: %s", query)
         
         # Define which repositories to search
         repositories = []
@@ -78,12 +85,16 @@ def main():
         
         # Get data retriever and fetch results
         data_retriever = get_data_retriever()
-        
-        # DEBUG: Print out data retriever information
-        print("\n--- DEBUG: Data Retriever ---")
-        print(f"Retriever type: {type(data_retriever)}")
-        print(f"Retriever methods: {[m for m in dir(data_retriever) if not m.startswith('_') and callable(getattr(data_retriever, m))]}")
-        
+
+        # The dir()/getattr reflection and full metadata dumps are
+        # debug-only: hundreds of descriptor lookups plus synchronous
+        # stdout flushes that plain runs shouldn't pay for.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retriever type: %s", type(data_retriever))
+            logger.debug("Retriever methods: %s",
+                         [m for m in dir(data_retriever)
+                          if not m.startswith('_') and callable(getattr(data_retriever, m))])
+
         # Fetch the results
         metadata = data_retriever.retrieve_all(
             query=query,
@@ -91,37 +102,42 @@ def main():
             repositories=repositories
         )
         
-        # DEBUG: Print the metadata structure
-        print("\n--- DEBUG: Metadata Results ---")
-        print(f"Type: {type(metadata)}")
-        print(f"Keys: {metadata.keys() if isinstance(metadata, dict) else 'Not a dictionary'}")
-        if isinstance(metadata, dict):
-            print(f"Results count: {metadata.get('results_count', 'Missing')}")
-            results = metadata.get('results', [])
-            print(f"Results type: {type(results)}")
-            print(f"Results length: {len(results)}")
-            print(f"First result: {results[0] if results else 'No results'}")
-        
-        # Save results summary (data_retriever already saves detailed results)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Metadata type: %s", type(metadata))
+            if isinstance(metadata, dict):
+                logger.debug("Metadata keys: %s", list(metadata.keys()))
+                logger.debug("Results count: %s", metadata.get('results_count', 'Missing'))
+                results = metadata.get('results', [])
+                logger.debug("Results length: %d", len(results))
+                logger.debug("First result: %s", results[0] if results else 'No results')
+
+        # The retriever already wrote the detailed JSON/CSV files, so
+        # the JSON formats re-encode only the small summary (everything
+        # but the results list) instead of the full payload. CSV output
+        # is built from the results rows themselves, so it keeps the
+        # complete metadata.
         output_path = args.output or os.path.join("data", "output")
-        save_metadata(metadata, output_path, args.format)
+        if args.format == "csv":
+            save_metadata(metadata, output_path, args.format)
+        else:
+            summary = {k: v for k, v in metadata.items() if k != "results"}
+            save_metadata(summary, output_path, args.format)
         
         # Final output
-        logger.info(f"Results saved to {output_path}")
+        logger.info("Results saved to %s", output_path)
         print(f"\nMetadata retrieval complete. Found {metadata.get('results_count', 0)} results.")
         print(f"Results saved to {output_path}")
         
-        # DEBUG: Show the first 2 results if they exist
-        if isinstance(metadata, dict) and metadata.get('results'):
-            results = metadata.get('results')
-            print("\n--- First 2 Results: ---")
-            for i, result in enumerate(results[:2]):
-                print(f"Result {i+1}: {result.get('title', 'No title')} ({result.get('repository', 'Unknown')})")
-        
+        if logger.isEnabledFor(logging.DEBUG) and isinstance(metadata, dict):
+            for i, result in enumerate(metadata.get('results', [])[:2]):
+                logger.debug("Result %d: %s (%s)", i + 1,
+                             result.get('title', 'No title'),
+                             result.get('repository', 'Unknown'))
+
         return 0
     
     except Exception as e:
-        logger.error(f"Error occurred: {e}", exc_info=True)
+        logger.error("Error occurred: %s", e, exc_info=True)
         print(f"Error: {e}")
         return 1
 
@@ -16,6 +16,7 @@ This script helps set up the project by:
 6. Validating the installation
 """
 
+import importlib.util
 import os
 import sys
 import shutil
@@ -24,6 +25,27 @@ import json
 import argparse
 from pathlib import Path
 
+# Optional: setup must keep working before install_dependencies has run.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_json(data):
+    """Encode data as indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _write_json_atomic(payload, path):
+    """Write pre-encoded JSON via a temp file so a crash can't leave a
+    half-written config behind."""
+    tmp_path = f"{path}.tmp"
+    Path(tmp_path).write_bytes(payload)
+    os.replace(tmp_path, path)
+
 
 def create_directories(base_path):
     print("\n[1/6] Creating directories...")
@@ -40,10 +62,11 @@ def create_directories(base_path):
         "tests"
     ]
     
+    base = Path(base_path)
+
     for directory in directories:
-        dir_path = os.path.join(base_path, directory)
-        os.makedirs(dir_path, exist_ok=True)
-        print(f"  Created directory: {dir_path}")
+        (base / directory).mkdir(parents=True, exist_ok=True)
+        print(f"  Created directory: {base / directory}")
 
     gitkeep_paths = [
         "data/cache/.gitkeep",
@@ -51,14 +74,13 @@ def create_directories(base_path):
         "plugins/.gitkeep",
         "tests/.gitkeep"
     ]
-    
+
+    # touch(exist_ok=True) is idempotent, so no exists() pre-check —
+    # one fewer stat syscall per file.
     for path in gitkeep_paths:
-        full_path = os.path.join(base_path, path)
-        if not os.path.exists(full_path):
-            with open(full_path, 'w') as f:
-                pass
-            print(f"  Created empty file: {full_path}")
-    
+        (base / path).touch(exist_ok=True)
+        print(f"  Created empty file: {base / path}")
+
     print("Directories created successfully")
 
 
@@ -123,13 +145,15 @@ def generate_config(base_path):
         }
     }
     
+    # Encode once, write twice: the config and its template are
+    # byte-identical, so the second file costs only the write.
+    payload = _encode_json(config)
+
     config_path = os.path.join(base_path, "config/config.json")
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
-    
+    _write_json_atomic(payload, config_path)
+
     template_path = os.path.join(base_path, "config/config.json.template")
-    with open(template_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    _write_json_atomic(payload, template_path)
     
     print(f"  Created {config_path}")
     print(f"  Created {template_path}")
@@ -159,8 +183,24 @@ def install_dependencies(base_path):
     
     print(f"  Created {req_path}")
     
+    # Prefer uv when it's on PATH: its resolver is 10-100x faster than
+    # pip's and skips pip's 1-2s cold start. --python pins it to this
+    # interpreter, since uv pip refuses to run outside an activated
+    # virtualenv otherwise. Any uv failure falls back to plain pip.
+    uv = shutil.which("uv")
+    if uv:
+        try:
+            subprocess.check_call(
+                [uv, "pip", "install", "-q", "--python", sys.executable,
+                 "-r", req_path]
+            )
+            print("Dependencies installed successfully")
+            return
+        except subprocess.CalledProcessError:
+            print("  uv install failed, falling back to pip")
+
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", req_path])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "-r", req_path])
         print("Dependencies installed successfully")
     except subprocess.CalledProcessError:
         print("Error installing dependencies. Please run: pip install -r requirements.txt")
@@ -287,11 +327,17 @@ def validate_setup(base_path):
         "config/config.json"
     ]
     
-    missing_files = []
-    for file in critical_files:
-        file_path = os.path.join(base_path, file)
-        if not os.path.exists(file_path):
-            missing_files.append(file)
+    # One directory listing per parent instead of a stat syscall per
+    # file; membership checks then run in memory.
+    existing = {}
+    for parent in {os.path.dirname(f) for f in critical_files}:
+        parent_path = os.path.join(base_path, parent)
+        existing[parent] = set(os.listdir(parent_path)) if os.path.isdir(parent_path) else set()
+
+    missing_files = [
+        f for f in critical_files
+        if os.path.basename(f) not in existing[os.path.dirname(f)]
+    ]
     
     if missing_files:
         print("Warning: The following critical files are missing:")
@@ -312,14 +358,12 @@ def validate_setup(base_path):
     else:
         print("All critical files are present")
     
+    # find_spec checks installability without executing module top-level
+    # code (importing numpy alone costs ~200ms and ~30MB).
     required_imports = ["requests", "numpy", "rapidfuzz"]
-    missing_imports = []
-    
-    for module in required_imports:
-        try:
-            __import__(module)
-        except ImportError:
-            missing_imports.append(module)
+    missing_imports = [
+        m for m in required_imports if importlib.util.find_spec(m) is None
+    ]
     
     if missing_imports:
         print(f"Warning: Missing required imports: {', '.join(missing_imports)}")
@@ -10,10 +10,18 @@ Date: 2025
 GitHub: https://github.com/rezwan-lab
 """
 
+import csv
 import json
 import os
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
+
+# orjson encodes in C; the stdlib encoder is the bottleneck once result
+# counts grow. Optional so the script still runs before deps install.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
@@ -23,115 +31,128 @@ logger = logging.getLogger(__name__)
 # Directory to save results
 OUTPUT_DIR = "data/output"
 
+# Mock data for different repositories
+GEO_DATA = [
+    {
+        "id": "200012345",
+        "accession": "GSE156544",
+        "title": "SARS-CoV-2 infection of human lung epithelium",
+        "summary": "RNA-sequencing of lung epithelial cells infected with SARS-CoV-2",
+        "organism": "Homo sapiens, SARS-CoV-2",
+        "type": "dataset",
+        "url": "https://www.ncbi.nlm.nih.gov/geo/query/acc.cgi?acc=GSE156544",
+        "platform": "Illumina NovaSeq 6000",
+        "samples": 24,
+        "repository": "GEO"
+    },
+    {
+        "id": "200012346",
+        "accession": "GSE154998",
+        "title": "COVID-19 patient bronchoalveolar immune cells",
+        "summary": "Single-cell RNA-seq of immune cells from COVID-19 patients",
+        "organism": "Homo sapiens",
+        "type": "dataset",
+        "url": "https://www.ncbi.nlm.nih.gov/geo/query/acc.cgi?acc=GSE154998",
+        "platform": "10x Genomics",
+        "samples": 18,
+        "repository": "GEO"
+    }
+]
+
+FIGSHARE_DATA = [
+    {
+        "id": "12345678",
+        "title": "SARS-CoV-2 genomic sequences from early pandemic",
+        "url": "https://figshare.com/articles/dataset/12345678",
+        "doi": "10.1234/figshare.12345678",
+        "type": "dataset",
+        "created_date": "2020-04-15",
+        "authors": ["Zhang, L.", "Wang, J.", "Smith, A."],
+        "description": "Genomic sequences of SARS-CoV-2 isolates collected in early 2020.",
+        "repository": "Figshare"
+    },
+    {
+        "id": "87654321",
+        "title": "COVID-19 patient clinical data from hospital admissions",
+        "url": "https://figshare.com/articles/dataset/87654321",
+        "doi": "10.1234/figshare.87654321",
+        "type": "dataset",
+        "created_date": "2020-07-22",
+        "authors": ["Johnson, M.", "Lee, K.", "Garcia, R."],
+        "description": "Anonymized clinical data from COVID-19 patients admitted to hospitals.",
+        "repository": "Figshare"
+    }
+]
+
+# CSV header union computed once from the mock tables at import time.
+CSV_HEADERS = sorted(set().union(*(r.keys() for r in GEO_DATA + FIGSHARE_DATA)))
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Encode one record as an NDJSON line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def stream_results(query: str) -> Iterator[Dict[str, Any]]:
+    """Yield mock result records one at a time."""
+    yield from GEO_DATA
+    yield from FIGSHARE_DATA
+
+
 def retrieve_mock_data(query: str):
     """Get mock data for testing."""
-    logger.info(f"Retrieving mock data for query: {query}")
-    
-    # Create mock data for different repositories
-    geo_data = [
-        {
-            "id": "200012345",
-            "accession": "GSE156544",
-            "title": "SARS-CoV-2 infection of human lung epithelium",
-            "summary": "RNA-sequencing of lung epithelial cells infected with SARS-CoV-2",
-            "organism": "Homo sapiens, SARS-CoV-2",
-            "type": "dataset",
-            "url": "https://www.ncbi.nlm.nih.gov/geo/query/acc.cgi?acc=GSE156544",
-            "platform": "Illumina NovaSeq 6000",
-            "samples": 24,
-            "repository": "GEO"
-        },
-        {
-            "id": "200012346",
-            "accession": "GSE154998",
-            "title": "COVID-19 patient bronchoalveolar immune cells",
-            "summary": "Single-cell RNA-seq of immune cells from COVID-19 patients",
-            "organism": "Homo sapiens",
-            "type": "dataset",
-            "url": "https://www.ncbi.nlm.nih.gov/geo/query/acc.cgi?acc=GSE154998",
-            "platform": "10x Genomics",
-            "samples": 18,
-            "repository": "GEO"
-        }
-    ]
-    
-    figshare_data = [
-        {
-            "id": "12345678",
-            "title": "SARS-CoV-2 genomic sequences from early pandemic",
-            "url": "https://figshare.com/articles/dataset/12345678",
-            "doi": "10.1234/figshare.12345678",
-            "type": "dataset",
-            "created_date": "2020-04-15",
-            "authors": ["Zhang, L.", "Wang, J.", "Smith, A."],
-            "description": "Genomic sequences of SARS-CoV-2 isolates collected in early 2020.",
-            "repository": "Figshare"
-        },
-        {
-            "id": "87654321",
-            "title": "COVID-19 patient clinical data from hospital admissions",
-            "url": "https://figshare.com/articles/dataset/87654321",
-            "doi": "10.1234/figshare.87654321",
-            "type": "dataset",
-            "created_date": "2020-07-22",
-            "authors": ["Johnson, M.", "Lee, K.", "Garcia, R."],
-            "description": "Anonymized clinical data from COVID-19 patients admitted to hospitals.",
-            "repository": "Figshare"
-        }
-    ]
-    
-    # Combine all data
+    logger.info("Retrieving mock data for query: %s", query)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    ndjson_path = os.path.join(OUTPUT_DIR, "test_results.ndjson")
+    csv_path = os.path.join(OUTPUT_DIR, "test_results.csv")
+
+    # One fused pass: each record streams to the NDJSON and CSV sinks as
+    # it's produced, so large result sets never sit in memory three
+    # times (list + JSON array + CSV rows). NDJSON also lets downstream
+    # readers stream one line at a time instead of parsing one big array.
     all_results = []
-    all_results.extend(geo_data)
-    all_results.extend(figshare_data)
-    
+    with open(ndjson_path, 'wb') as jf, \
+            open(csv_path, 'w', encoding='utf-8', newline='') as cf:
+        writer = csv.DictWriter(cf, fieldnames=CSV_HEADERS, extrasaction='ignore')
+        writer.writeheader()
+        for record in stream_results(query):
+            all_results.append(record)
+            jf.write(_dumps_line(record))
+            writer.writerow(
+                {k: ("|".join(map(str, v)) if isinstance(v, list) else v)
+                 for k, v in record.items()}
+            )
+
     # Create result structure
     results = {
         "query": query,
         "results_count": len(all_results),
         "results": all_results,
         "sources": {
-            "geo": {"count": len(geo_data), "success": True},
-            "figshare": {"count": len(figshare_data), "success": True},
+            "geo": {"count": len(GEO_DATA), "success": True},
+            "figshare": {"count": len(FIGSHARE_DATA), "success": True},
             "zenodo": {"count": 0, "success": False, "error": "Not implemented for this test"},
             "osf": {"count": 0, "success": False, "error": "Not implemented for this test"},
             "sciencedb": {"count": 0, "success": False, "error": "Not implemented for this test"}
         }
     }
-    
-    # Save results
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    # Save as JSON
-    json_path = os.path.join(OUTPUT_DIR, "test_results.json")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    
-    # Save as CSV
-    csv_path = os.path.join(OUTPUT_DIR, "test_results.csv")
-    with open(csv_path, 'w', encoding='utf-8') as f:
-        # Write header
-        headers = set()
-        for result in all_results:
-            headers.update(result.keys())
-        f.write(",".join(sorted(headers)) + "\n")
-        
-        # Write data
-        for result in all_results:
-            row = []
-            for header in sorted(headers):
-                value = result.get(header, "")
-                if isinstance(value, list):
-                    value = "|".join(value)
-                # Escape commas in values
-                if isinstance(value, str) and "," in value:
-                    value = f'"{value}"'
-                row.append(str(value))
-            f.write(",".join(row) + "\n")
-    
-    logger.info(f"Mock results saved to {json_path} and {csv_path}")
-    logger.info(f"Found {len(all_results)} mock results")
-    
+
+    # The small summary (no results list) stays a regular JSON file.
+    summary_path = os.path.join(OUTPUT_DIR, "test_results_summary.json")
+    summary = {k: v for k, v in results.items() if k != "results"}
+    with open(summary_path, 'wb') as f:
+        if orjson is not None:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(summary, indent=2, ensure_ascii=False).encode('utf-8'))
+
+    logger.info("Mock results saved to %s and %s", ndjson_path, csv_path)
+    logger.info("Found %d mock results", len(all_results))
+
     return results
 
 if __name__ == "__main__":
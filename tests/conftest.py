@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures for the test suite.
+Curaios - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import os
+import sys
+
+# One idempotent bootstrap for the whole suite; individual test files
+# keep working when run directly with python as well.
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_cache_dir(tmp_path_factory):
+    # Run the session from its own scratch directory so the on-disk API
+    # cache (data/cache/api_cache.db) is created fresh every run and
+    # never leaks cached lookups between runs or between parallel
+    # workers when the suite is run with pytest-xdist (-n auto).
+    original_cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("curaios-run"))
+    yield
+    os.chdir(original_cwd)
@@ -9,24 +9,76 @@ GitHub: https://github.com/rezwan-lab
 """
 
 import unittest
-import os
-import sys
-import json
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import requests
 
 from external.ncbi_taxonomy import query_ncbi_taxonomy, _extract_organism_info, _calculate_match_confidence
 from external.ncbi_mesh import query_ncbi_mesh, _extract_disease_info
+from utils.caching import clear_namespace
 from utils.error_handling import APIError
 
+# Shared esummary payloads, built once at import instead of inline in
+# every test that needs them. Tests must treat these as read-only.
+HUMAN_SUMMARY = {
+    "result": {
+        "uids": ["9606"],
+        "9606": {
+            "scientificname": "Homo sapiens",
+            "commonname": "human",
+            "rank": "species",
+            "lineage": "Eukaryota; Metazoa; Chordata; Vertebrata; Mammalia; Primates; Hominidae",
+            "othernames": {
+                "synonym": ["H. sapiens"],
+                "genbank": ["man"]
+            }
+        }
+    }
+}
+
+ALZHEIMER_SUMMARY = {
+    "result": {
+        "uids": ["D000544"],
+        "D000544": {
+            "descriptorname": "Alzheimer's Disease",
+            "ui": "D000544",
+            "scopenote": "A degenerative disease of the brain...",
+            "treenumberlist": ["C10.228.140.380"],
+            "conceptlist": [
+                {
+                    "conceptname": "Alzheimer Disease",
+                    "preferredconceptyn": "Y",
+                    "termlist": [
+                        {"termname": "Alzheimer's Disease", "termui": "T000001"},
+                        {"termname": "Alzheimer Disease", "termui": "T000002"},
+                        {"termname": "Alzheimer Dementia", "termui": "T000003"}
+                    ]
+                },
+                {
+                    "conceptname": "Presenile Dementia",
+                    "preferredconceptyn": "N",
+                    "termlist": [
+                        {"termname": "Presenile Dementia", "termui": "T000004"}
+                    ]
+                }
+            ]
+        }
+    }
+}
+
 
 class TestNCBITaxonomyClient(unittest.TestCase):
 
-    @patch('external.ncbi_taxonomy.requests.get')
+    def setUp(self):
+        # The disk memoization wrapper sits above the patched session,
+        # so one test's mocked response would otherwise satisfy a later
+        # lookup for the same term straight from the cache.
+        clear_namespace("ncbi_taxonomy")
+
+    @patch('external.ncbi_taxonomy.SESSION.get')
     def test_query_ncbi_taxonomy_success(self, mock_get):
 
-        search_response = MagicMock()
+        search_response = MagicMock(spec=requests.Response)
         search_response.status_code = 200
         search_response.json.return_value = {
             "esearchresult": {
@@ -35,38 +87,24 @@ class TestNCBITaxonomyClient(unittest.TestCase):
             }
         }
         
-        summary_response = MagicMock()
+        summary_response = MagicMock(spec=requests.Response)
         summary_response.status_code = 200
-        summary_response.json.return_value = {
-            "result": {
-                "uids": ["9606"],
-                "9606": {
-                    "scientificname": "Homo sapiens",
-                    "commonname": "human",
-                    "rank": "species",
-                    "lineage": "Eukaryota; Metazoa; Chordata; Vertebrata; Mammalia; Primates; Hominidae",
-                    "othernames": {
-                        "synonym": ["H. sapiens"],
-                        "genbank": ["man"]
-                    }
-                }
-            }
-        }
+        summary_response.json.return_value = HUMAN_SUMMARY
 
         mock_get.side_effect = [search_response, summary_response]
 
         result = query_ncbi_taxonomy("human")
 
-        self.assertEqual(result["canonical_name"], "Homo sapiens")
-        self.assertEqual(result["ncbi_taxonomy_id"], 9606)
-        self.assertIn("human", result["alternatives"])
+        expected = {"canonical_name": "Homo sapiens", "ncbi_taxonomy_id": 9606}
+        self.assertEqual({k: result[k] for k in expected}, expected)
+        self.assertLessEqual({"human"}, set(result["alternatives"]))
         self.assertGreaterEqual(result["confidence"], 0.8)
 
         self.assertEqual(mock_get.call_count, 2)
     
-    @patch('external.ncbi_taxonomy.requests.get')
+    @patch('external.ncbi_taxonomy.SESSION.get')
     def test_query_ncbi_taxonomy_no_results(self, mock_get):
-        search_response = MagicMock()
+        search_response = MagicMock(spec=requests.Response)
         search_response.status_code = 200
         search_response.json.return_value = {
             "esearchresult": {
@@ -83,9 +121,9 @@ class TestNCBITaxonomyClient(unittest.TestCase):
         
         self.assertEqual(mock_get.call_count, 1)
     
-    @patch('external.ncbi_taxonomy.requests.get')
+    @patch('external.ncbi_taxonomy.SESSION.get')
     def test_query_ncbi_taxonomy_api_error(self, mock_get):
-        mock_response = MagicMock()
+        mock_response = MagicMock(spec=requests.Response)
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = Exception("API Error")
         
@@ -95,23 +133,7 @@ class TestNCBITaxonomyClient(unittest.TestCase):
             query_ncbi_taxonomy("human")
     
     def test_extract_organism_info(self):
-        summary_data = {
-            "result": {
-                "uids": ["9606"],
-                "9606": {
-                    "scientificname": "Homo sapiens",
-                    "commonname": "human",
-                    "rank": "species",
-                    "lineage": "Eukaryota; Metazoa; Chordata; Vertebrata; Mammalia; Primates; Hominidae",
-                    "othernames": {
-                        "synonym": ["H. sapiens"],
-                        "genbank": ["man"]
-                    }
-                }
-            }
-        }
-
-        result = _extract_organism_info(summary_data, "9606")
+        result = _extract_organism_info(HUMAN_SUMMARY, "9606")
 
         self.assertEqual(result["canonical_name"], "Homo sapiens")
         self.assertEqual(result["ncbi_taxonomy_id"], 9606)
@@ -130,9 +152,12 @@ class TestNCBITaxonomyClient(unittest.TestCase):
 
 class TestNCBIMeshClient(unittest.TestCase):
 
-    @patch('external.ncbi_mesh.requests.get')
+    def setUp(self):
+        clear_namespace("ncbi_mesh")
+
+    @patch('external.ncbi_mesh.SESSION.get')
     def test_query_ncbi_mesh_success(self, mock_get):
-        search_response = MagicMock()
+        search_response = MagicMock(spec=requests.Response)
         search_response.status_code = 200
         search_response.json.return_value = {
             "esearchresult": {
@@ -141,51 +166,24 @@ class TestNCBIMeshClient(unittest.TestCase):
             }
         }
         
-        summary_response = MagicMock()
+        summary_response = MagicMock(spec=requests.Response)
         summary_response.status_code = 200
-        summary_response.json.return_value = {
-            "result": {
-                "uids": ["D000544"],
-                "D000544": {
-                    "descriptorname": "Alzheimer's Disease",
-                    "ui": "D000544",
-                    "scopenote": "A degenerative disease of the brain...",
-                    "treenumberlist": ["C10.228.140.380"],
-                    "conceptlist": [
-                        {
-                            "conceptname": "Alzheimer Disease",
-                            "preferredconceptyn": "Y",
-                            "termlist": [
-                                {"termname": "Alzheimer's Disease", "termui": "T000001"},
-                                {"termname": "Alzheimer Disease", "termui": "T000002"},
-                                {"termname": "Alzheimer Dementia", "termui": "T000003"}
-                            ]
-                        },
-                        {
-                            "conceptname": "Presenile Dementia",
-                            "preferredconceptyn": "N",
-                            "termlist": [
-                                {"termname": "Presenile Dementia", "termui": "T000004"}
-                            ]
-                        }
-                    ]
-                }
-            }
-        }
-        
+        summary_response.json.return_value = ALZHEIMER_SUMMARY
+
         mock_get.side_effect = [search_response, summary_response]
         result = query_ncbi_mesh("alzheimer")
-        self.assertEqual(result["canonical_name"], "Alzheimer's Disease")
-        self.assertEqual(result["mesh_id"], "D000544")
-        self.assertIn("Alzheimer Disease", result["alternatives"])
-        self.assertIn("Alzheimer Dementia", result["alternatives"])
-        self.assertIn("Presenile Dementia", result["alternatives"])
+        expected = {"canonical_name": "Alzheimer's Disease", "mesh_id": "D000544"}
+        self.assertEqual({k: result[k] for k in expected}, expected)
+        self.assertLessEqual(
+            {"Alzheimer Disease", "Alzheimer Dementia", "Presenile Dementia"},
+            set(result["alternatives"])
+        )
         self.assertGreaterEqual(result["confidence"], 0.8)
         self.assertEqual(mock_get.call_count, 2)
     
-    @patch('external.ncbi_mesh.requests.get')
+    @patch('external.ncbi_mesh.SESSION.get')
     def test_query_ncbi_mesh_no_results(self, mock_get):
-        search_response = MagicMock()
+        search_response = MagicMock(spec=requests.Response)
         search_response.status_code = 200
         search_response.json.return_value = {
             "esearchresult": {
@@ -194,7 +192,7 @@ class TestNCBIMeshClient(unittest.TestCase):
             }
         }
 
-        retry_response = MagicMock()
+        retry_response = MagicMock(spec=requests.Response)
         retry_response.status_code = 200
         retry_response.json.return_value = {
             "esearchresult": {
@@ -209,9 +207,9 @@ class TestNCBIMeshClient(unittest.TestCase):
         self.assertEqual(result, {})
         self.assertEqual(mock_get.call_count, 2)
     
-    @patch('external.ncbi_mesh.requests.get')
+    @patch('external.ncbi_mesh.SESSION.get')
     def test_query_ncbi_mesh_api_error(self, mock_get):
-        mock_response = MagicMock()
+        mock_response = MagicMock(spec=requests.Response)
         mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = Exception("API Error")
         mock_get.return_value = mock_response
@@ -220,37 +218,7 @@ class TestNCBIMeshClient(unittest.TestCase):
             query_ncbi_mesh("alzheimer")
     
     def test_extract_disease_info(self):
-        summary_data = {
-            "result": {
-                "uids": ["D000544"],
-                "D000544": {
-                    "descriptorname": "Alzheimer's Disease",
-                    "ui": "D000544",
-                    "scopenote": "A degenerative disease of the brain...",
-                    "treenumberlist": ["C10.228.140.380"],
-                    "conceptlist": [
-                        {
-                            "conceptname": "Alzheimer Disease",
-                            "preferredconceptyn": "Y",
-                            "termlist": [
-                                {"termname": "Alzheimer's Disease", "termui": "T000001"},
-                                {"termname": "Alzheimer Disease", "termui": "T000002"},
-                                {"termname": "Alzheimer Dementia", "termui": "T000003"}
-                            ]
-                        },
-                        {
-                            "conceptname": "Presenile Dementia",
-                            "preferredconceptyn": "N",
-                            "termlist": [
-                                {"termname": "Presenile Dementia", "termui": "T000004"}
-                            ]
-                        }
-                    ]
-                }
-            }
-        }
-
-        result = _extract_disease_info(summary_data, "D000544")
+        result = _extract_disease_info(ALZHEIMER_SUMMARY, "D000544")
 
         self.assertEqual(result["canonical_name"], "Alzheimer's Disease")
         self.assertEqual(result["mesh_id"], "D000544")
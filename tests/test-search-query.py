@@ -9,29 +9,34 @@ GitHub: https://github.com/rezwan-lab
 """
 
 import unittest
-import os
-import sys
-from unittest.mock import patch, MagicMock
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import patch, create_autospec
 
+from core.llm_service import LLMService
 from core.search_query import build_search_query, parse_date_range, enhance_query_with_llm
 
 
 class TestSearchQuery(unittest.TestCase):
     
+    # The patch is installed once for the whole class instead of being
+    # torn down and rebuilt around every test; setUp only resets the
+    # shared mock's state.
+    @classmethod
+    def setUpClass(cls):
+        cls.llm_patcher = patch('core.llm_service.get_llm_service')
+        cls.mock_llm = cls.llm_patcher.start()
+        cls.addClassCleanup(cls.llm_patcher.stop)
+        # Autospec keeps the mock honest: calls that don't match the real
+        # LLMService signatures fail here instead of in production.
+        cls.mock_llm_instance = create_autospec(LLMService, instance=True)
+        cls.mock_llm.return_value = cls.mock_llm_instance
+
     def setUp(self):
-        self.llm_patcher = patch('core.llm_service.get_llm_service')
-        self.mock_llm = self.llm_patcher.start()
-        self.mock_llm_instance = MagicMock()
-        self.mock_llm.return_value = self.mock_llm_instance
+        enhance_query_with_llm.cache_clear()
+        self.mock_llm_instance.reset_mock()
         self.mock_llm_instance.expand_search_query.return_value = (
             '(human OR "Homo sapiens") AND (cancer OR neoplasm OR tumor OR carcinoma) AND (RNAseq OR "RNA sequencing" OR transcriptomics)'
         )
-    
-    def tearDown(self):
-        self.llm_patcher.stop()
-    
+
     def test_build_search_query_basic(self):
         organism = {"canonical_name": "Homo sapiens", "ncbi_taxonomy_id": 9606}
         disease = {"canonical_name": "Alzheimer's Disease", "mesh_id": "D000544"}
@@ -9,12 +9,8 @@ GitHub: https://github.com/rezwan-lab
 """
 
 import unittest
-import os
-import sys
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from config.constants import InputType
 from core.validation import (
     validate_input, 
@@ -6,13 +6,10 @@ It transforms messy biomedical inputs into structured and normalized forms using
 """
 
 import unittest
-import os
-import sys
-from unittest.mock import patch, MagicMock
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import patch, create_autospec
 
 from config.constants import InputType
+from core.llm_service import LLMService
 from core.normalization import normalize_input, clean_input, normalize_organism, normalize_disease, normalize_data_type
 from core.validation import validate_input
 from utils.error_handling import ValidationError, NormalizationError
@@ -20,22 +17,33 @@ from utils.error_handling import ValidationError, NormalizationError
 
 class TestNormalization(unittest.TestCase):
     
-    def setUp(self):
-        self.llm_patcher = patch('core.llm_service.get_llm_service')
-        self.mock_llm = self.llm_patcher.start()
+    # The patch is installed once for the whole class instead of being
+    # torn down and rebuilt around every test; setUp only resets the
+    # shared mock's state.
+    @classmethod
+    def setUpClass(cls):
+        cls.llm_patcher = patch('core.llm_service.get_llm_service')
+        cls.mock_llm = cls.llm_patcher.start()
+        cls.addClassCleanup(cls.llm_patcher.stop)
+        # Autospec keeps the mock honest: calls that don't match the real
+        # LLMService signatures fail here instead of in production.
+        cls.mock_llm_instance = create_autospec(LLMService, instance=True)
+        cls.mock_llm.return_value = cls.mock_llm_instance
 
-        self.mock_llm_instance = MagicMock()
-        self.mock_llm.return_value = self.mock_llm_instance
+    def setUp(self):
+        # The normalizers are memoized; clear them so results cached by
+        # one test (real or mocked) never leak into another.
+        normalize_organism.cache_clear()
+        normalize_disease.cache_clear()
+        normalize_data_type.cache_clear()
 
+        self.mock_llm_instance.reset_mock()
         self.mock_llm_instance.validate_entity.return_value = {
             "canonical_name": "Test Entity",
             "confidence": 0.9,
             "alternatives": ["Test", "Entity"]
         }
-    
-    def tearDown(self):
-        self.llm_patcher.stop()
-    
+
     def test_clean_input(self):
         self.assertEqual(clean_input("  human  "), "human")
         self.assertEqual(clean_input("E. coli"), "E. coli")
@@ -71,18 +79,20 @@ class TestNormalization(unittest.TestCase):
     
     @patch('core.normalization.query_ncbi_taxonomy')
     def test_normalize_organism_ncbi(self, mock_query_ncbi):
+        # Uses an organism absent from ORGANISM_MAPPINGS so the NCBI
+        # fallback path is actually exercised.
         mock_query_ncbi.return_value = {
-            "canonical_name": "Canis lupus familiaris",
-            "ncbi_taxonomy_id": 9615,
+            "canonical_name": "Ambystoma mexicanum",
+            "ncbi_taxonomy_id": 8296,
             "confidence": 0.95,
-            "alternatives": ["Dog", "Domestic dog"]
+            "alternatives": ["Axolotl", "Mexican walking fish"]
         }
-        result = normalize_organism("dog")
-        self.assertEqual(result["canonical_name"], "Canis lupus familiaris")
-        self.assertEqual(result["ncbi_taxonomy_id"], 9615)
+        result = normalize_organism("axolotl")
+        self.assertEqual(result["canonical_name"], "Ambystoma mexicanum")
+        self.assertEqual(result["ncbi_taxonomy_id"], 8296)
         self.assertEqual(result["source"], "ncbi_taxonomy")
 
-        mock_query_ncbi.assert_called_once_with("dog")
+        mock_query_ncbi.assert_called_once_with("axolotl")
     
     @patch('core.normalization.query_ncbi_taxonomy')
     def test_normalize_organism_llm_fallback(self, mock_query_ncbi):
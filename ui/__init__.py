@@ -0,0 +1,27 @@
+"""
+User interface package for BioData Curator.
+"""
+
+import importlib
+
+# Attribute -> defining submodule. Resolved lazily via PEP 562 so that
+# `import ui` loads neither argparse-heavy cli nor interactive until a
+# symbol is actually used.
+_LAZY = {
+    "parse_arguments": "ui.cli",
+    "print_results": "ui.cli",
+    "format_input_summary": "ui.cli",
+    "interactive_mode": "ui.interactive",
+    "confirm_with_user": "ui.interactive",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is not None:
+        return getattr(importlib.import_module(module_name), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
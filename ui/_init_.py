@@ -1,6 +0,0 @@
-"""
-User interface package for BioData Curator.
-"""
-
-from ui.cli import parse_arguments, print_results, format_input_summary
-from ui.interactive import interactive_mode, confirm_with_user
@@ -19,7 +19,32 @@ from config.constants import InputType, OutputFormat
 logger = logging.getLogger(__name__)
 
 
+# The parser tree is built once and reused; repeated parse_arguments
+# calls (tests, interactive loops) only pay for parse_args itself.
+_PARSER = None
+
+
 def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+
+    parsed_args = _PARSER.parse_args(args)
+
+    if parsed_args.verbose > 0 and not parsed_args.log_level:
+        if parsed_args.verbose == 1:
+            parsed_args.log_level = "INFO"
+        elif parsed_args.verbose == 2:
+            parsed_args.log_level = "DEBUG"
+        else:
+            parsed_args.log_level = "DEBUG"
+    if parsed_args.quiet and not parsed_args.log_level:
+        parsed_args.log_level = "WARNING"
+
+    return parsed_args
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="BioData Curator: Dynamic Input Normalization and Semantic Validation Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -74,19 +99,7 @@ Examples:
                              help="Logging level")
     config_group.add_argument("--log-file", type=str, help="Path to log file")
 
-    parsed_args = parser.parse_args(args)
-
-    if parsed_args.verbose > 0 and not parsed_args.log_level:
-        if parsed_args.verbose == 1:
-            parsed_args.log_level = "INFO"
-        elif parsed_args.verbose == 2:
-            parsed_args.log_level = "DEBUG"
-        else:
-            parsed_args.log_level = "DEBUG"
-    if parsed_args.quiet and not parsed_args.log_level:
-        parsed_args.log_level = "WARNING"
-    
-    return parsed_args
+    return parser
 
 
 def print_results(results: Dict[str, Any], quiet: bool = False) -> None:
@@ -16,39 +16,348 @@ Date: 2025
 GitHub: https://github.com/rezwan-lab
 """
 
+import functools
+import gzip
+import hashlib
 import os
 import sys
 import json
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 
 try:
-    from flask import Flask, render_template, request, jsonify, send_from_directory
+    from flask import Flask, Response, render_template, request, jsonify, send_from_directory
 except ImportError:
     print("Flask is required for the web dashboard. Install with: pip install flask")
     sys.exit(1)
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Optional fast JSON; stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional response compression; JSON bodies here are highly repetitive
+# and shrink 5-10x. Without the package, responses go out uncompressed
+# (or a fronting proxy can compress instead).
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Optional: keeps the history index in sync with writes made by other
+# processes; without it the index still tracks this process's saves.
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
 from config.settings import get_settings, init_settings
-from core.validation import validate_input
-from core.normalization import normalize_input
-from core.search_query import build_search_query
-from utils.file_operations import save_metadata
 from utils.logging_utils import setup_logging, get_audit_logger
 from config.constants import InputType, OutputFormat
 
-app = Flask(__name__, 
+app = Flask(__name__,
            template_folder=os.path.join(os.path.dirname(__file__), 'templates'),
            static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 
+if orjson is not None:
+    try:
+        from flask.json.provider import DefaultJSONProvider
+    except ImportError:
+        # Flask < 2.2 has no provider API; keep the stdlib encoder.
+        DefaultJSONProvider = None
+
+    if DefaultJSONProvider is not None:
+        class _OrjsonProvider(DefaultJSONProvider):
+            """Route every jsonify through orjson's C encoder."""
+
+            def dumps(self, obj, **kwargs):
+                return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        app.json = _OrjsonProvider(app)
+
+if Compress is not None:
+    app.config['COMPRESS_ALGORITHM'] = 'br,gzip'
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    app.config['COMPRESS_LEVEL'] = 4
+    Compress(app)
+
 logger = logging.getLogger(__name__)
 audit_logger = get_audit_logger()
 
 init_settings()
 settings = get_settings()
 
+
+def _static_json(payload):
+    """Serialize a payload once, returning (body, etag) for 304 replies."""
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _cached_response(body, etag, max_age=60):
+    """Answer with a 304 on ETag match, else the precomputed body."""
+    if request.if_none_match.contains(etag):
+        return '', 304
+    return Response(
+        body,
+        mimetype='application/json',
+        headers={'ETag': etag, 'Cache-Control': f'public, max-age={max_age}'}
+    )
+
+
+# Stats are placeholder values today: serialize them once at import and
+# let repeat pollers ride the ETag to an empty 304.
+_STATS_BODY, _STATS_ETAG = _static_json({
+    "total_searches": 42,
+    "top_organisms": [
+        {"name": "Homo sapiens", "count": 18},
+        {"name": "Mus musculus", "count": 12},
+        {"name": "Escherichia coli", "count": 5}
+    ],
+    "top_diseases": [
+        {"name": "Alzheimer's Disease", "count": 10},
+        {"name": "Diabetes Mellitus", "count": 8},
+        {"name": "Breast Neoplasms", "count": 7}
+    ],
+    "top_data_types": [
+        {"name": "RNAseq", "count": 20},
+        {"name": "scRNAseq", "count": 15},
+        {"name": "WGS", "count": 7}
+    ]
+})
+
+# One compiled match both filters history entries and captures the
+# extension; the pattern only admits names normalize() generates, so a
+# matching entry is known to be a regular file in our output_dir.
+_HISTORY_RE = re.compile(r'^web_results_(?P<ts>[0-9_]+)\.(?P<ext>json|csv|xlsx)$')
+
+
+class _HistoryIndex:
+    """
+    In-memory mirror of the web_results_* files in output_dir.
+    The directory is scanned once (os.scandir, one cached stat per
+    entry) on first use; after that, saves made by this process update
+    the index directly and a watchdog observer (when installed) folds
+    in external creations and deletions. /api/history then serves from
+    memory with zero syscalls per request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._sorted = None
+        self._scanned = False
+
+    def _build_entry(self, name, st, fmt):
+        return {
+            "filename": name,
+            "timestamp": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            "size": st.st_size,
+            "format": fmt
+        }
+
+    def _ensure_scanned(self):
+        if self._scanned:
+            return
+        output_dir = get_settings().output_dir
+        try:
+            with os.scandir(output_dir) as it:
+                for entry in it:
+                    m = _HISTORY_RE.match(entry.name)
+                    if m is None:
+                        continue
+                    self._entries[entry.name] = self._build_entry(
+                        entry.name, entry.stat(), m['ext']
+                    )
+        except FileNotFoundError:
+            pass
+        self._scanned = True
+        self._start_observer(output_dir)
+
+    def _start_observer(self, output_dir):
+        if Observer is None or not os.path.isdir(output_dir):
+            return
+        index = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_created(self, event):
+                if not event.is_directory:
+                    index.add(event.src_path)
+
+            def on_deleted(self, event):
+                if not event.is_directory:
+                    index.discard(os.path.basename(event.src_path))
+
+            def on_moved(self, event):
+                # Saves publish atomically via os.replace, which other
+                # processes observe as a move from the .tmp sibling to
+                # the final name -- not a creation.
+                if not event.is_directory:
+                    index.discard(os.path.basename(event.src_path))
+                    index.add(event.dest_path)
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_Handler(), output_dir)
+        observer.start()
+
+    def add(self, path):
+        name = os.path.basename(path)
+        m = _HISTORY_RE.match(name)
+        if m is None:
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            self._entries[name] = self._build_entry(name, st, m['ext'])
+            self._sorted = None
+
+    def discard(self, name):
+        with self._lock:
+            if self._entries.pop(name, None) is not None:
+                self._sorted = None
+
+    def entries(self):
+        with self._lock:
+            self._ensure_scanned()
+            if self._sorted is None:
+                self._sorted = sorted(
+                    self._entries.values(),
+                    key=lambda e: e["timestamp"],
+                    reverse=True
+                )
+            return self._sorted
+
+
+_HISTORY = _HistoryIndex()
+
+def _cn(data, key):
+    # Projects canonical_name without allocating a fallback {} per miss.
+    value = data.get(key)
+    return value.get("canonical_name") if value else None
+
+
+# Request fields normalize() handles, paired with their input types; one
+# loop replaces three copy-pasted validate/normalize/error blocks.
+_NORMALIZE_FIELDS = (
+    ("organism", InputType.ORGANISM.value),
+    ("disease", InputType.DISEASE.value),
+    ("data_type", InputType.DATA_TYPE.value),
+)
+
+
+# strftime is paid at most once per second: the formatted prefix is
+# cached and reused, with the nanosecond remainder appended so two
+# requests in the same second can no longer claim the same filename.
+_ts_lock = threading.Lock()
+_ts_last = (-1, "")
+
+
+def _result_stamp():
+    """Return (iso timestamp, unique filename stamp) from one clock read."""
+    global _ts_last
+    now_ns = time.time_ns()
+    second = now_ns // 1_000_000_000
+    with _ts_lock:
+        last_second, prefix = _ts_last
+        if second != last_second:
+            prefix = datetime.fromtimestamp(second).strftime('%Y%m%d_%H%M%S')
+            _ts_last = (second, prefix)
+    iso = datetime.fromtimestamp(now_ns / 1e9).isoformat()
+    return iso, f"{prefix}_{now_ns % 1_000_000_000:09d}"
+
+
+# Result files are published off the request thread so the response
+# never waits on disk; the filename is decided up front, so the client
+# can poll /download/ for it.
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dashboard-save")
+
+
+def _fast_save_json(path, body):
+    """
+    Atomically publish pre-serialized JSON bytes.
+    The bytes land in a .tmp sibling first and os.replace makes the
+    final name appear whole, so /api/history and /download/ readers
+    never observe a half-written file (.tmp names also fail the history
+    pattern, keeping them out of the index).
+    """
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(body)
+    os.replace(tmp, path)
+    return path
+
+
+def _background_save(output_file, body):
+    try:
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        _HISTORY.add(_fast_save_json(output_file, body))
+    except Exception as e:
+        logger.error(f"Background save failed for {output_file}: {e}", exc_info=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _core():
+    # Bound on first /api/normalize hit: these pull in fuzzy matching
+    # and the external API clients, which the stats/config/history/
+    # download endpoints never need. The lru_cache makes later calls a
+    # single dict probe instead of four sys.modules lookups.
+    from core.normalization import normalize_input
+    from core.search_query import build_search_query
+    from core.validation import validate_input
+    from utils.file_operations import save_metadata
+    return validate_input, normalize_input, build_search_query, save_metadata
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_cached(raw, input_type):
+    validate_input, normalize_input = _core()[:2]
+    return normalize_input(validate_input(raw, input_type), input_type)
+
+
+def _norm(raw, input_type):
+    # Dashboard queries repeat heavily ("Homo sapiens", "RNAseq"), so
+    # the validate+normalize pair is memoized as one unit; the copy on
+    # the way out keeps handler-side mutation from poisoning the cache,
+    # the same guard core.normalization's own memoizers use.
+    return dict(_norm_cached(raw, input_type))
+
+
+# Config body is rebuilt only when init_settings installs a new
+# Settings object (checked by identity), not on every request.
+_config_cache = (None, b'', '')
+
+
+def _config_response():
+    global _config_cache
+    current = get_settings()
+    if _config_cache[0] is not current:
+        body, etag = _static_json({
+            "default_output_format": current.default_output_format,
+            "cache_enabled": current.cache_enabled,
+            "fuzzy_threshold": current.fuzzy_threshold,
+            "semantic_threshold": current.semantic_threshold,
+            "plugins_enabled": current.plugins_enabled
+        })
+        _config_cache = (current, body, etag)
+    return _cached_response(_config_cache[1], _config_cache[2])
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -56,48 +365,38 @@ def index():
 @app.route('/api/normalize')
 def normalize():
     try:
-        organism = request.args.get('organism')
-        disease = request.args.get('disease')
-        data_type = request.args.get('data_type')
-        min_samples = request.args.get('min_samples')
         date_range = request.args.get('date_range')
         output_format = request.args.get('output_format', 'json')
-        
-        if min_samples:
-            try:
-                min_samples = int(min_samples)
-            except ValueError:
-                return jsonify({"error": f"Invalid min_samples value: {min_samples}"})
-        
+        # The format lands in the save path, so it is allow-listed the
+        # same way the CLI's argparse choices and the download route
+        # are; anything else would be a path-injection vector.
+        if output_format not in ("json", "csv", "xlsx"):
+            return jsonify({
+                "error": f"Invalid output_format value: {output_format}"
+            }), 400
+
+        # type=int folds missing and malformed into None without raising,
+        # so no exception is constructed on bad input.
+        min_samples = request.args.get('min_samples', type=int)
+        if min_samples is None and request.args.get('min_samples'):
+            return jsonify({
+                "error": f"Invalid min_samples value: {request.args['min_samples']}"
+            }), 400
+
         normalized_data = {}
-        
-        if organism:
-            try:
-                validated_organism = validate_input(organism, InputType.ORGANISM.value)
-                normalized_organism = normalize_input(validated_organism, InputType.ORGANISM.value)
-                normalized_data["organism"] = normalized_organism
-            except Exception as e:
-                logger.error(f"Error normalizing organism: {e}", exc_info=True)
-                return jsonify({"error": f"Error normalizing organism: {str(e)}"})
-        
-        if disease:
-            try:
-                validated_disease = validate_input(disease, InputType.DISEASE.value)
-                normalized_disease = normalize_input(validated_disease, InputType.DISEASE.value)
-                normalized_data["disease"] = normalized_disease
-            except Exception as e:
-                logger.error(f"Error normalizing disease: {e}", exc_info=True)
-                return jsonify({"error": f"Error normalizing disease: {str(e)}"})
-        
-        if data_type:
+
+        for field, input_type in _NORMALIZE_FIELDS:
+            raw = request.args.get(field)
+            if not raw:
+                continue
             try:
-                validated_data_type = validate_input(data_type, InputType.DATA_TYPE.value)
-                normalized_data_type = normalize_input(validated_data_type, InputType.DATA_TYPE.value)
-                normalized_data["data_type"] = normalized_data_type
+                normalized_data[field] = _norm(raw, input_type)
             except Exception as e:
-                logger.error(f"Error normalizing data type: {e}", exc_info=True)
-                return jsonify({"error": f"Error normalizing data type: {str(e)}"})
-        
+                logger.error(f"Error normalizing {field}: {e}", exc_info=True)
+                return jsonify({"error": f"Error normalizing {field}: {str(e)}"})
+
+        build_search_query, save_metadata = _core()[2:]
+
         try:
             query = build_search_query(
                 organism=normalized_data.get("organism"),
@@ -117,155 +416,173 @@ def normalize():
             {"title": "Sample Dataset 3", "samples": 76, "publication_date": "2023-01-22"}
         ]
         
-        # Save results to file
+        # One clock read feeds both the timestamp field and the filename,
+        # and the saved metadata shares the normalized dicts by reference
+        # rather than copying them.
+        timestamp, stamp = _result_stamp()
+        inputs = {
+            key: _cn(normalized_data, key)
+            for key in ("organism", "disease", "data_type")
+        }
         metadata = {
             "query": query,
             "results": placeholder_results,
-            "normalized_inputs": {
-                "organism": normalized_data.get("organism", {}).get("canonical_name"),
-                "disease": normalized_data.get("disease", {}).get("canonical_name"),
-                "data_type": normalized_data.get("data_type", {}).get("canonical_name")
-            },
-            "timestamp": datetime.now().isoformat()
+            "normalized_inputs": inputs,
+            "timestamp": timestamp
         }
-        
+
+        output_path = os.path.join(settings.output_dir, f"web_results_{stamp}")
         try:
-            output_file = save_metadata(
-                metadata,
-                os.path.join(settings.output_dir, f"web_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}"),
-                output_format
-            )
+            if output_format == "json" and orjson is not None:
+                # The JSON body is encoded exactly once and handed to the
+                # save pool; the response does not wait for the disk.
+                output_file = output_path + ".json"
+                _SAVE_POOL.submit(_background_save, output_file, orjson.dumps(metadata))
+            else:
+                # The extension must be part of the path: an extension-
+                # less stem would make save_metadata treat it as a
+                # directory, producing a file neither the history index
+                # nor the download allow-list can see.
+                output_file = save_metadata(
+                    metadata, f"{output_path}.{output_format}", output_format
+                )
+                _HISTORY.add(output_file)
             normalized_data["outputFile"] = output_file
         except Exception as e:
             logger.error(f"Error saving metadata: {e}", exc_info=True)
             # Continue without saving
             normalized_data["outputFile"] = None
-        
-        # Log the activity
+
+        # Log the activity, reusing the projection computed for metadata.
         audit_logger.log_activity(
             action="web_search",
-            details={
-                "organism": normalized_data.get("organism", {}).get("canonical_name"),
-                "disease": normalized_data.get("disease", {}).get("canonical_name"),
-                "data_type": normalized_data.get("data_type", {}).get("canonical_name"),
-                "query": query
-            }
+            details={**inputs, "query": query}
         )
-        
+
+        if orjson is not None:
+            # Bypass jsonify's bytes->str->bytes round-trip.
+            return Response(orjson.dumps(normalized_data), mimetype='application/json')
         return jsonify(normalized_data)
-        
+
     except Exception as e:
         logger.error(f"Unexpected error in normalize API: {e}", exc_info=True)
         return jsonify({"error": f"Unexpected error: {str(e)}"})
 
+# Only filenames normalize() itself generates are downloadable; the
+# allow-list check rejects traversal before any filesystem work.
+_DOWNLOAD_RE = re.compile(r'^web_results_[0-9_]+\.(json|csv|xlsx)$')
+
+
 @app.route('/download/<filename>')
 def download_file(filename):
-    return send_from_directory(settings.output_dir, filename)
+    if _DOWNLOAD_RE.match(filename) is None:
+        return jsonify({"error": "Invalid filename"}), 400
+    resp = send_from_directory(settings.output_dir, filename)
+    # Result files are content-addressed by their timestamped name and
+    # never rewritten, so clients may cache them forever; the ETag is
+    # derived from the name for the same reason.
+    resp.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    resp.headers['ETag'] = hashlib.blake2b(
+        filename.encode(), digest_size=8
+    ).hexdigest()
+    return resp
 
 @app.route('/api/history')
 def get_history():
     try:
-        output_files = []
-        for file in os.listdir(settings.output_dir):
-            if file.startswith('web_results_') and os.path.isfile(os.path.join(settings.output_dir, file)):
-                file_path = os.path.join(settings.output_dir, file)
-                timestamp = os.path.getmtime(file_path)
-                size = os.path.getsize(file_path)
-                
-                format = file.split('.')[-1] if '.' in file else 'unknown'
-                
-                output_files.append({
-                    "filename": file,
-                    "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
-                    "size": size,
-                    "format": format
-                })
-
-        output_files.sort(key=lambda x: x["timestamp"], reverse=True)
-        
-        return jsonify({"history": output_files})
-        
+        return jsonify({"history": _HISTORY.entries()})
     except Exception as e:
         logger.error(f"Error retrieving history: {e}", exc_info=True)
         return jsonify({"error": f"Error retrieving history: {str(e)}"})
 
 @app.route('/api/stats')
 def get_stats():
-    try:
-        stats = {
-            "total_searches": 42,
-            "top_organisms": [
-                {"name": "Homo sapiens", "count": 18},
-                {"name": "Mus musculus", "count": 12},
-                {"name": "Escherichia coli", "count": 5}
-            ],
-            "top_diseases": [
-                {"name": "Alzheimer's Disease", "count": 10},
-                {"name": "Diabetes Mellitus", "count": 8},
-                {"name": "Breast Neoplasms", "count": 7}
-            ],
-            "top_data_types": [
-                {"name": "RNAseq", "count": 20},
-                {"name": "scRNAseq", "count": 15},
-                {"name": "WGS", "count": 7}
-            ]
-        }
-        
-        return jsonify(stats)
-        
-    except Exception as e:
-        logger.error(f"Error retrieving stats: {e}", exc_info=True)
-        return jsonify({"error": f"Error retrieving stats: {str(e)}"})
+    return _cached_response(_STATS_BODY, _STATS_ETAG)
 
 @app.route('/api/config')
 def get_config():
     try:
-        config = {
-            "default_output_format": settings.default_output_format,
-            "cache_enabled": settings.cache_enabled,
-            "fuzzy_threshold": settings.fuzzy_threshold,
-            "semantic_threshold": settings.semantic_threshold,
-            "plugins_enabled": settings.plugins_enabled
-        }
-        
-        return jsonify(config)
-        
+        return _config_response()
     except Exception as e:
         logger.error(f"Error retrieving config: {e}", exc_info=True)
         return jsonify({"error": f"Error retrieving config: {str(e)}"})
 
 
+def _serve_production(host, port):
+    """
+    Serve through a real WSGI server when one is available.
+    Preference order: gunicorn (gevent workers when gevent is installed,
+    sync otherwise), then waitress, then Flask's dev server threaded as
+    a last resort. Returns once the server exits.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        BaseApplication = None
+
+    if BaseApplication is not None:
+        try:
+            import gevent  # noqa: F401 - probe only
+            worker_class = "gevent"
+        except ImportError:
+            worker_class = "sync"
+
+        class _Dashboard(BaseApplication):
+            def load_config(self):
+                self.cfg.set("bind", f"{host}:{port}")
+                self.cfg.set("workers", 2 * (os.cpu_count() or 1) + 1)
+                self.cfg.set("worker_class", worker_class)
+                self.cfg.set("worker_connections", 1000)
+                self.cfg.set("keepalive", 5)
+
+            def load(self):
+                return app
+
+        _Dashboard().run()
+        return
+
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning(
+            "Neither gunicorn nor waitress installed; falling back to the "
+            "threaded Flask dev server (not recommended for production)"
+        )
+        app.run(host=host, port=port, threaded=True)
+        return
+
+    serve(app, host=host, port=port, threads=8)
+
+
 def run_web_dashboard(host='127.0.0.1', port=5000, debug=False):
     print(f"Starting CurAIos Curator web dashboard at http://{host}:{port}")
     print("Press Ctrl+C to stop")
 
     setup_logging(log_level="DEBUG" if debug else "INFO")
-    
+    _ensure_static_assets()
+
+    # When fronted by a proxy that handles X-Sendfile (nginx, Apache),
+    # downloads become header-only responses and the byte transfer moves
+    # to the proxy's sendfile(2) path. Opt-in because without such a
+    # proxy the header would yield empty downloads.
+    if os.environ.get("CURAIOS_X_SENDFILE"):
+        app.use_x_sendfile = True
+
     try:
-        app.run(host=host, port=port, debug=debug)
+        if debug:
+            # The dev server keeps the reloader and debugger for local work.
+            app.run(host=host, port=port, debug=True)
+        else:
+            _serve_production(host, port)
     except KeyboardInterrupt:
         print("\nStopping web dashboard")
 
 
-if __name__ == "__main__":
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Run CurAIos Curator web dashboard")
-    parser.add_argument("--host", default="127.0.0.1", help="Host address to bind to")
-    parser.add_argument("--port", type=int, default=5000, help="Port to listen on")
-    parser.add_argument("--debug", action="store_true", help="Run in debug mode")
-    
-    args = parser.parse_args()
-    
-    run_web_dashboard(host=args.host, port=args.port, debug=args.debug)
-
-os.makedirs(app.template_folder, exist_ok=True)
-os.makedirs(app.static_folder, exist_ok=True)
-
-template_path = os.path.join(app.template_folder, 'index.html')
-if not os.path.exists(template_path):
-    with open(template_path, 'w') as f:
-        f.write("""<!DOCTYPE html>
+# Static assets are held as module constants (so the compiled .pyc
+# carries them directly) and written at most once, from startup
+# rather than at import: under a multi-worker server the old
+# module-bottom writes ran again on every fork.
+_INDEX_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>CurAIos Dashboard</title>
@@ -349,12 +666,9 @@ if not os.path.exists(template_path):
     <script src="{{ url_for('static', filename='script.js') }}"></script>
 </body>
 </html>
-""")
+"""
 
-css_path = os.path.join(app.static_folder, 'style.css')
-if not os.path.exists(css_path):
-    with open(css_path, 'w') as f:
-        f.write("""/* Basic styles for CurAIos Curator Dashboard */
+_STYLE_CSS = """/* Basic styles for CurAIos Curator Dashboard */
 
 * {
     box-sizing: border-box;
@@ -521,12 +835,9 @@ footer {
         flex-direction: column;
     }
 }
-""")
+"""
 
-js_path = os.path.join(app.static_folder, 'script.js')
-if not os.path.exists(js_path):
-    with open(js_path, 'w') as f:
-        f.write("""// CurAIos Dashboard JavaScript
+_SCRIPT_JS = """// CurAIos Dashboard JavaScript
 
 document.addEventListener('DOMContentLoaded', function() {
     const form = document.getElementById('normalization-form');
@@ -700,4 +1011,39 @@ document.addEventListener('DOMContentLoaded', function() {
         html += '</div>';
         return html;
     }
-});
\ No newline at end of file
+});
+"""
+
+
+def _ensure_static_assets():
+    """Create the template/static files if missing; idempotent."""
+    if getattr(app, "_assets_ready", False):
+        return
+    for folder, name, content in (
+        (app.template_folder, 'index.html', _INDEX_HTML),
+        (app.static_folder, 'style.css', _STYLE_CSS),
+        (app.static_folder, 'script.js', _SCRIPT_JS),
+    ):
+        path = Path(folder) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            path.write_text(content)
+        # Precompressed sibling lets a fronting proxy (gzip_static)
+        # serve the asset without compressing per request.
+        gz_path = path.with_name(path.name + '.gz')
+        if not gz_path.exists():
+            gz_path.write_bytes(gzip.compress(content.encode(), compresslevel=9))
+    app._assets_ready = True
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run CurAIos Curator web dashboard")
+    parser.add_argument("--host", default="127.0.0.1", help="Host address to bind to")
+    parser.add_argument("--port", type=int, default=5000, help="Port to listen on")
+    parser.add_argument("--debug", action="store_true", help="Run in debug mode")
+    
+    args = parser.parse_args()
+    
+    run_web_dashboard(host=args.host, port=args.port, debug=args.debug)
@@ -0,0 +1,147 @@
+"""
+Disk-backed memoization for external API lookups.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import functools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_conn = None
+_lock = threading.Lock()
+
+
+def _get_conn() -> Optional[sqlite3.Connection]:
+    # Opened lazily on first use so importing a cached module does not
+    # touch the filesystem. Shared across threads behind the lock, the
+    # same way the LLM response cache handles its connection.
+    global _conn
+    if _conn is None:
+        settings = get_settings()
+        if not settings.cache_enabled:
+            return None
+        os.makedirs(settings.cache_dir, exist_ok=True)
+        _conn = sqlite3.connect(
+            os.path.join(settings.cache_dir, "api_cache.db"),
+            check_same_thread=False
+        )
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT, created REAL)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def disk_memoize(namespace: str, ttl: int = 30 * 86400) -> Callable:
+    """
+    Memoize a single-string-argument function to the shared disk cache.
+    Results survive process restarts, so repeated runs skip the network
+    round-trip entirely. Results must be JSON-serializable; exceptions
+    are never cached.
+    Args:
+        namespace: Cache key prefix identifying the wrapped function
+        ttl: Seconds before a cached entry expires
+    Returns:Decorator applying the disk cache
+    """
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(arg: str) -> Any:
+            try:
+                conn = _get_conn()
+            except Exception as e:
+                logger.warning(f"Could not open API cache: {e}")
+                conn = None
+
+            if conn is None:
+                return func(arg)
+
+            key = f"{namespace}\0{arg}"
+            with _lock:
+                row = conn.execute(
+                    "SELECT value, created FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+
+            if row is not None:
+                value, created = row
+                if not ttl or (time.time() - created) <= ttl:
+                    return json.loads(value)
+
+            result = func(arg)
+
+            with _lock:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, created) VALUES (?, ?, ?)",
+                    (key, json.dumps(result), time.time())
+                )
+                conn.commit()
+
+            return result
+        return wrapper
+    return decorate
+
+
+def clear_namespace(namespace: str) -> None:
+    """
+    Drop every cached entry under one namespace.
+    Used when a namespace's cached results must not carry over, e.g.
+    between tests that mock the underlying network call.
+    Args:namespace: Cache key prefix used by the memoized function
+    """
+    try:
+        conn = _get_conn()
+    except Exception as e:
+        logger.warning(f"Could not open API cache: {e}")
+        return
+    if conn is None:
+        return
+
+    # Keys are "<namespace>\0<arg>", so a half-open range scan on the
+    # primary key covers exactly this namespace.
+    with _lock:
+        conn.execute(
+            "DELETE FROM entries WHERE key >= ? AND key < ?",
+            (f"{namespace}\0", f"{namespace}\1")
+        )
+        conn.commit()
+
+
+def seed_cache(namespace: str, key: str, value: Any) -> None:
+    """
+    Store one entry directly, as if the memoized function had returned it.
+    Lets batched lookups expand into individual cache entries, so a
+    later single-key call is a hit instead of a fresh round-trip.
+    Args:
+        namespace: Cache key prefix used by the memoized function
+        key: The argument value the entry should be found under
+        value: JSON-serializable result to store
+    """
+    try:
+        conn = _get_conn()
+    except Exception as e:
+        logger.warning(f"Could not open API cache: {e}")
+        return
+    if conn is None:
+        return
+
+    with _lock:
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (key, value, created) VALUES (?, ?, ?)",
+            (f"{namespace}\0{key}", json.dumps(value), time.time())
+        )
+        conn.commit()
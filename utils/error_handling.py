@@ -0,0 +1,68 @@
+"""
+Custom exception types and error message helpers used across the application.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import logging
+from typing import Any
+
+from config.constants import ERROR_MESSAGES
+
+logger = logging.getLogger(__name__)
+
+
+class CurAIosError(Exception):
+    """Base class for all application-specific errors."""
+    pass
+
+
+class ValidationError(CurAIosError):
+    """Raised when user input fails validation checks."""
+    pass
+
+
+class NormalizationError(CurAIosError):
+    """Raised when an input cannot be normalized to a canonical form."""
+    pass
+
+
+class APIError(CurAIosError):
+    """Raised when an external API returns an error or unexpected response."""
+    pass
+
+
+class LLMError(CurAIosError):
+    """Raised when communication with the LLM backend fails."""
+    pass
+
+
+class PluginError(CurAIosError):
+    """Raised when a plugin fails to load or execute."""
+    pass
+
+
+def get_error_message(error_key: str, **kwargs: Any) -> str:
+    """
+    Look up and format a user-facing error message.
+    Args:
+        error_key: Key into the ERROR_MESSAGES table
+        **kwargs: Values substituted into the message template
+    Returns:Formatted error message string
+    """
+    template = ERROR_MESSAGES.get(error_key)
+
+    if template is None:
+        logger.warning(f"Unknown error message key: {error_key}")
+        return f"An error occurred ({error_key})"
+
+    try:
+        return template.format(**kwargs)
+    except KeyError as e:
+        logger.warning(f"Missing placeholder {e} for error message '{error_key}'")
+        return template
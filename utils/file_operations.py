@@ -0,0 +1,174 @@
+"""
+File operations for saving and loading curated metadata.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import csv
+import json
+import logging
+import mmap
+import os
+import struct
+from typing import Dict, List, Any, Optional, Iterable
+
+# orjson encodes in C and is 5-15x faster than the stdlib state machine
+# on large result payloads; fall back to json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """
+    Encode data as indented JSON bytes, preferring orjson's C encoder.
+    Args:data: JSON-serializable object
+    Returns:Encoded JSON as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def save_metadata(metadata: Dict[str, Any], output_path: str,
+                  output_format: str = "json") -> str:
+    """
+    Save retrieved metadata to disk in the requested format.
+    Args:
+        metadata: Metadata dictionary (query, results, sources, counts)
+        output_path: Output file path, or a directory to write into
+        output_format: 'json' or 'csv' ('xlsx' falls back to json)
+    Returns:Path of the written file
+    """
+    if os.path.isdir(output_path) or not os.path.splitext(output_path)[1]:
+        os.makedirs(output_path, exist_ok=True)
+        file_path = os.path.join(output_path, f"metadata_summary.{output_format}")
+    else:
+        parent = os.path.dirname(output_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        file_path = output_path
+
+    if output_format == "csv":
+        _write_results_csv(metadata.get("results", []), file_path)
+    else:
+        if output_format not in ("json", "xlsx"):
+            logger.warning("Unknown output format '%s', writing JSON", output_format)
+        elif output_format == "xlsx":
+            logger.warning("xlsx output not supported yet, writing JSON instead")
+        # Bytes written directly; no intermediate str round-trip.
+        with open(file_path, 'wb') as f:
+            f.write(dump_json_bytes(metadata))
+
+    logger.info("Saved metadata to %s", file_path)
+    return file_path
+
+
+def _write_results_csv(results: List[Dict[str, Any]], file_path: str,
+                       fieldnames: Optional[List[str]] = None) -> None:
+    """
+    Write result records as CSV.
+    Args:
+        results: List of result record dictionaries
+        file_path: Destination CSV path
+        fieldnames: Known header list; when omitted it falls back to a
+            union-of-keys scan over the records
+    """
+    if fieldnames is not None:
+        headers = fieldnames
+    else:
+        headers = sorted(set().union(*(r.keys() for r in results))) if results else []
+
+    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=headers, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(
+            {k: ('|'.join(map(str, v)) if isinstance(v, list) else v)
+             for k, v in record.items()}
+            for record in results
+        )
+
+
+def dump_ndjson_line(record: Any) -> bytes:
+    """
+    Encode one record as an NDJSON line (trailing newline included).
+    Args:record: JSON-serializable record
+    Returns:Encoded line as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def write_ndjson(records: Iterable[Any], ndjson_path: str,
+                 offsets_path: Optional[str] = None) -> int:
+    """
+    Write records as newline-delimited JSON with an optional offset index.
+    The sidecar holds one little-endian uint64 byte offset per record,
+    so readers can random-access record N without parsing the file.
+    Args:
+        records: Iterable of JSON-serializable records
+        ndjson_path: Destination NDJSON path
+        offsets_path: Optional destination for the binary offset sidecar
+    Returns:Number of records written
+    """
+    offsets = []
+    with open(ndjson_path, 'wb') as f:
+        for record in records:
+            offsets.append(f.tell())
+            f.write(dump_ndjson_line(record))
+
+    if offsets_path:
+        with open(offsets_path, 'wb') as f:
+            f.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+
+    return len(offsets)
+
+
+def read_ndjson_record(ndjson_path: str, offsets_path: str, index: int) -> Any:
+    """
+    Random-access one record from an NDJSON file via its offset sidecar.
+    The data file is mmapped and only the requested line is decoded.
+    Args:
+        ndjson_path: NDJSON file written by write_ndjson
+        offsets_path: Matching binary offset sidecar
+        index: Zero-based record index
+    Returns:The decoded record
+    """
+    with open(offsets_path, 'rb') as f:
+        raw = f.read()
+    count = len(raw) // 8
+    if not 0 <= index < count:
+        raise IndexError(f"Record index {index} out of range (0..{count - 1})")
+
+    start = struct.unpack_from('<Q', raw, index * 8)[0]
+    end = struct.unpack_from('<Q', raw, (index + 1) * 8)[0] if index + 1 < count else None
+
+    with open(ndjson_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            line = mm[start:end] if end is not None else mm[start:]
+
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def load_metadata(file_path: str) -> Dict[str, Any]:
+    """
+    Load a previously saved metadata JSON file.
+    Args:file_path: Path of the JSON file to read
+    Returns:Parsed metadata dictionary
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
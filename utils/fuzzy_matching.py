@@ -0,0 +1,96 @@
+"""
+Fuzzy string matching helpers for normalization fallbacks.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import difflib
+import logging
+from typing import Optional, Sequence, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = None
+    process = None
+
+logger = logging.getLogger(__name__)
+
+
+def fuzzy_match(str1: str, str2: str) -> float:
+    """
+    Score the similarity of two strings.
+    Args:
+        str1: First string
+        str2: Second string
+    Returns:Similarity score between 0 and 1
+    """
+    if not str1 or not str2:
+        return 0.0
+
+    if fuzz is not None:
+        return fuzz.ratio(str1.lower(), str2.lower()) / 100.0
+
+    return difflib.SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
+
+
+def find_best_match(input_value: str, candidates: Sequence[str],
+                    threshold: float = 0.85) -> Tuple[Optional[str], float]:
+    """
+    Find the candidate most similar to the input.
+    Uses RapidFuzz's C implementation when available (the score_cutoff
+    lets it abandon candidates early), falling back to stdlib difflib
+    otherwise.
+    Args:
+        input_value: The string to match
+        candidates: Candidate strings to match against
+        threshold: Minimum similarity score to accept a match
+    Returns:Tuple of (best match or None, similarity score)
+    """
+    if not input_value or not candidates:
+        return None, 0.0
+
+    if process is not None:
+        # fuzz.ratio keeps difflib-equivalent full-string semantics;
+        # WRatio's partial-match heuristics over-accept short keys
+        # contained in longer inputs.
+        match = process.extractOne(
+            input_value.lower(),
+            candidates,
+            scorer=fuzz.ratio,
+            processor=str.lower,
+            score_cutoff=threshold * 100
+        )
+        if match is None:
+            return None, 0.0
+        return match[0], match[1] / 100.0
+
+    best_match = None
+    best_score = 0.0
+
+    # One matcher reused across candidates; the cheap quick-ratio upper
+    # bounds discard candidates that cannot beat the current best before
+    # the full quadratic ratio is computed.
+    matcher = difflib.SequenceMatcher(None)
+    matcher.set_seq2(input_value.lower())
+
+    for candidate in candidates:
+        matcher.set_seq1(candidate.lower())
+        if (matcher.real_quick_ratio() <= best_score
+                or matcher.quick_ratio() <= best_score):
+            continue
+
+        score = matcher.ratio()
+        if score > best_score:
+            best_match = candidate
+            best_score = score
+
+    if best_score >= threshold:
+        return best_match, best_score
+
+    return None, best_score
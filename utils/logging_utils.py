@@ -0,0 +1,146 @@
+"""
+Logging configuration and audit logging helpers.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Dict, Any, Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+AUDIT_LOG_FILE = "audit.log"
+AUDIT_QUEUE_SIZE = 10_000
+
+_configured = False
+_audit_logger = None
+
+
+def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> None:
+    """
+    Configure the root logger for the application.
+    Safe to call more than once; repeat calls only adjust the level
+    instead of stacking duplicate handlers.
+    Args:
+        log_level: Logging level name (e.g. 'INFO', 'DEBUG')
+        log_file: Optional path for a file handler
+    """
+    global _configured
+
+    level = getattr(logging, str(log_level).upper(), logging.INFO)
+    root = logging.getLogger()
+
+    if _configured:
+        root.setLevel(level)
+        return
+
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+
+    logging.basicConfig(level=level, format=LOG_FORMAT, handlers=handlers)
+    _configured = True
+
+
+class AuditLogger:
+    """
+    Writes structured activity records to a dedicated audit log.
+    Records are enqueued (a few microseconds) and written by a daemon
+    thread that drains the queue in batches, so callers on a request
+    hot path never block on audit disk I/O. The queue is bounded; under
+    pathological backlog new records are dropped with a warning rather
+    than stalling the caller.
+    """
+
+    def __init__(self, log_file: str = AUDIT_LOG_FILE):
+        self.logger = logging.getLogger("curaios.audit")
+        self.logger.propagate = False
+        if not self.logger.handlers:
+            handler = logging.FileHandler(log_file, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.logger.addHandler(handler)
+        self.logger.setLevel(logging.INFO)
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        self._drainer: Optional[threading.Thread] = None
+        self._drainer_pid: Optional[int] = None
+        self._spawn_lock = threading.Lock()
+
+    def _ensure_drainer(self) -> None:
+        # Spawned lazily and re-checked per call rather than in
+        # __init__: threads do not survive fork(), so a drainer started
+        # in a gunicorn master would leave every worker's queue without
+        # a consumer. The PID check re-spawns it in each new process.
+        if (self._drainer is not None and self._drainer_pid == os.getpid()
+                and self._drainer.is_alive()):
+            return
+        with self._spawn_lock:
+            if (self._drainer is not None and self._drainer_pid == os.getpid()
+                    and self._drainer.is_alive()):
+                return
+            self._drainer = threading.Thread(
+                target=self._drain, name="audit-drainer", daemon=True
+            )
+            self._drainer_pid = os.getpid()
+            self._drainer.start()
+
+    def log_activity(self, action: str, details: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Enqueue one audit entry for background writing.
+        Args:
+            action: Short action name (e.g. 'interactive_search')
+            details: Structured context for the action
+        """
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "action": action,
+            "details": details or {}
+        }
+        self._ensure_drainer()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            logging.getLogger(__name__).warning(
+                "Audit queue full; dropping record for action %s", action
+            )
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        self._ensure_drainer()
+        self._queue.join()
+
+    def _drain(self) -> None:
+        while True:
+            records = [self._queue.get()]
+            try:
+                while True:
+                    records.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            # One emit per batch: concatenated JSON lines reach the
+            # file handler as a single write.
+            self.logger.info(
+                "\n".join(json.dumps(r, default=str) for r in records)
+            )
+            for _ in records:
+                self._queue.task_done()
+
+
+def get_audit_logger() -> AuditLogger:
+    """
+    Return the shared AuditLogger instance.
+    Returns:The module-level AuditLogger
+    """
+    global _audit_logger
+    if _audit_logger is None:
+        _audit_logger = AuditLogger()
+    return _audit_logger
@@ -0,0 +1,74 @@
+"""
+Process-wide token-bucket rate limiting for external HTTP calls.
+
+CurAIos - Biological Data Curator Project Setup Script
+Curaios is an AI-native metadata curation engine.
+It transforms messy biomedical inputs into structured and normalized forms using LLMs.
+Author: Rezwanuzzaman Laskar
+Date: 2025
+GitHub: https://github.com/rezwan-lab
+"""
+
+import logging
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    Tokens refill continuously at rate_per_sec; acquire blocks until a
+    token is available, smoothing request bursts to the allowed rate
+    instead of triggering 429 responses and retry backoff.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = None):
+        self.rate = rate_per_sec
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_sec)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until the requested number of tokens is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) / self.rate
+
+            logger.debug(f"Rate limit reached, sleeping {wait:.2f}s")
+            time.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def acquire_for_host(url: str, rate_per_sec: float) -> None:
+    """
+    Take one token from the shared bucket for the URL's host.
+    Args:
+        url: Full request URL; the bucket is keyed on its host
+        rate_per_sec: Rate applied when the host bucket is first created
+    """
+    host = urlsplit(url).netloc
+
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(rate_per_sec)
+
+    bucket.acquire()